@@ -38,6 +38,11 @@ bl_info = {
 }
 
 
+# Blender re-executes this module in its existing namespace when scripts are reloaded,
+# which is the only time the (already imported) subpackages need to be reloaded as well.
+is_reload = "bpy" in locals()
+
+
 import bpy
 import rna_keymap_ui
 from bpy.types import AddonPreferences
@@ -125,6 +130,11 @@ class NDPreferences(AddonPreferences):
         default=True,
     )
 
+    use_fast_boolean_previews: BoolProperty(
+        name="Use Fast Booleans while interactively previewing",
+        default=True,
+    )
+
     create_custom_transform_orientation: BoolProperty(
         name="Create Custom Transform Orientations with View Align",
         default=True,
@@ -144,6 +154,15 @@ class NDPreferences(AddonPreferences):
         default="DISABLE",
     )
 
+    sync_modifiers_mode: EnumProperty(
+        name="Sync Modifiers Mode",
+        items=[
+            ("DRIVERS", "Drivers", ""),
+            ("TEMPLATE", "Template Link", ""),
+        ],
+        default="DRIVERS",
+    )
+
     enable_axis_helper: BoolProperty(
         name="Enable Axis Visualization",
         default=True,
@@ -487,6 +506,7 @@ class NDPreferences(AddonPreferences):
     def draw_general(self, box):
         general_prefs = [
             "use_fast_booleans",
+            "use_fast_boolean_previews",
             "create_custom_transform_orientation",
             "enable_right_click_select",
             "enable_auto_smooth"]
@@ -500,6 +520,7 @@ class NDPreferences(AddonPreferences):
             ["The default angle to use for bevel and smoothing operations", "default_smoothing_angle", True, True],
             ["Automatically check if ND is up to date when Blender starts", "enable_update_check", False, not lib.addons.is_extension()],
             ["Utils toggle behaviour", "utils_toggle_behaviour", True, True],
+            ["Sync modifiers using drivers, or by pushing changes to linked copies", "sync_modifiers_mode", True, True],
             ["Enable experimental features (requires Blender restart)", "enable_experimental_features", False, True]]
 
         for label, prop, expanded, visible in general_boxed_prefs:
@@ -644,25 +665,38 @@ bpy.app.handlers.load_post.append(post_load_handler)
 
 
 def register():
-    lib.reload()
+    if is_reload:
+        lib.reload()
 
     bpy.utils.register_class(NDPreferences)
 
+    lib.handlers.register_handlers()
+
     for registerable in registerables:
-        registerable.reload()
+        if is_reload:
+            registerable.reload()
         registerable.register()
 
     version = (2, 1, 0)
     prefs = lib.preferences.get_preferences()
+    prefs.update_available = False
 
     if not lib.addons.is_extension() and prefs.enable_update_check:
-        prefs.update_available = lib.updates.update_available(version)
-    else:
-        prefs.update_available = False
+        lib.updates.check_for_update_async(version, set_update_available)
+
+
+def set_update_available(update_available):
+    try:
+        lib.preferences.get_preferences().update_available = update_available
+    except (KeyError, AttributeError):
+        # The add-on was disabled before the update check completed.
+        pass
 
 
 def unregister():
     for registerable in registerables:
         registerable.unregister()
 
+    lib.handlers.unregister_handlers()
+
     bpy.utils.unregister_class(NDPreferences)
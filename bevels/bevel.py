@@ -65,6 +65,7 @@ SHIFT — Create a stacked bevel modifier"""
         'MOVEMENT_PASSTHROUGH': True,
         'ON_CANCEL': lambda cls, context: cls.revert(context),
         'ON_CONFIRM': lambda cls, context: cls.finish(context),
+        'OPERATE_INTERVAL': 1 / 30,
     }
 
 
@@ -169,7 +170,7 @@ SHIFT — Create a stacked bevel modifier"""
                 self.percentage = max(0, round_dec(self.percentage - percent_factor))
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.segments_input_stream) and self.key_alt and self.has_mouse_step:
                 self.segments = max(1, self.segments + self.mouse_step)
                 self.mark_dirty()
@@ -30,7 +30,6 @@ from math import ceil, floor
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import init_overlay, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
-from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream
 from .. lib.polling import ctx_obj_mode, objs_are_mesh
 
@@ -84,7 +83,7 @@ class ND_OT_bevel_resolution(BaseOperator):
                 self.minimum_segments = max(self.minimum_segments - 1, 1)
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if self.key_no_modifiers and self.has_mouse_step:
                 self.segment_change = self.segment_change + self.mouse_step
                 self.mark_dirty()
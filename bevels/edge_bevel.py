@@ -27,13 +27,12 @@
 
 import bpy
 import bmesh
-from math import radians
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream, set_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with, ensure_tail_mod_consistency, add_smooth_by_angle
+from .. lib.modifiers import new_modifier, move_mod_to_index, remove_modifiers_ending_with, ensure_tail_mod_consistency, add_smooth_shading
 from .. lib.polling import ctx_edit_mode, obj_edges_selected, obj_is_mesh, app_minor_version
 from .. lib.math import round_dec
 
@@ -63,6 +62,7 @@ CTRL — Remove existing modifiers"""
         'MOVEMENT_PASSTHROUGH': True,
         'ON_CANCEL': lambda cls, context: cls.revert(context),
         'ON_CONFIRM': lambda cls, context: cls.finish(context),
+        'OPERATE_INTERVAL': 1 / 30,
     }
 
 
@@ -167,7 +167,7 @@ CTRL — Remove existing modifiers"""
                 self.weight = max(0, min(1, round_dec(self.weight - weight_factor)))
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.segments_input_stream) and self.key_alt and self.has_mouse_step:
                 self.segments = max(1, self.segments + self.mouse_step)
                 self.mark_dirty()
@@ -319,17 +319,7 @@ CTRL — Remove existing modifiers"""
         if not get_preferences().enable_auto_smooth:
             return
 
-        if app_minor_version() >= (4, 1):
-            bpy.ops.object.mode_set(mode='OBJECT')
-            add_smooth_by_angle(context, self.target_object)
-            bpy.ops.object.mode_set(mode='EDIT')
-            return
-
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.shade_smooth()
-        self.target_object.data.use_auto_smooth = True
-        self.target_object.data.auto_smooth_angle = radians(float(get_preferences().default_smoothing_angle))
-        bpy.ops.object.mode_set(mode='EDIT')
+        add_smooth_shading(context, self.target_object)
 
 
     def add_bevel_modifier(self, context):
@@ -342,8 +332,7 @@ CTRL — Remove existing modifiers"""
         self.bevel = bevel
 
         if self.early_apply:
-            while self.target_object.modifiers[0].name != self.bevel.name:
-                bpy.ops.object.modifier_move_up(modifier=self.bevel.name)
+            move_mod_to_index(self.target_object, self.bevel.name, 0)
 
 
     def add_weld_modifier(self, context):
@@ -359,8 +348,7 @@ CTRL — Remove existing modifiers"""
             self.weld = weld
 
             if self.early_apply:
-                while self.target_object.modifiers[1].name != self.weld.name:
-                    bpy.ops.object.modifier_move_up(modifier=self.weld.name)
+                move_mod_to_index(self.target_object, self.weld.name, 1)
 
 
     def take_edges_snapshot(self, context):
@@ -27,15 +27,16 @@
 
 import bpy
 import bmesh
-from math import radians
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream, set_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with, ensure_tail_mod_consistency, add_smooth_by_angle
+from .. lib.modifiers import new_modifier, move_mod_to_index, remove_modifiers_ending_with, ensure_tail_mod_consistency, add_smooth_shading
 from .. lib.polling import ctx_edit_mode, obj_edges_selected, obj_is_mesh, app_minor_version
 from .. lib.math import round_dec
+from .. lib.attributes import get_nd_edge_attribute_names, remove_nd_edge_attributes, get_edge_attribute_values_at, set_edge_attribute_values_at, new_edge_attribute, get_edge_attribute_bevels
+from .. lib.lazy import numpy
 
 
 MIN_BLENDER_VERSION = (4, 3)
@@ -160,7 +161,7 @@ Min Blender Version: """ + '.'.join([str(v) for v in MIN_BLENDER_VERSION])
                 self.percentage = max(0, round_dec(self.percentage - percent_factor))
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.segments_input_stream) and self.key_alt and self.has_mouse_step:
                 self.segments = max(1, self.segments + self.mouse_step)
                 self.mark_dirty()
@@ -204,12 +205,7 @@ Min Blender Version: """ + '.'.join([str(v) for v in MIN_BLENDER_VERSION])
             remove_modifiers_ending_with(context.selected_objects, ' — ND EBA')
             remove_modifiers_ending_with(context.selected_objects, ' — ND EBA')
 
-            bpy.ops.object.mode_set(mode='OBJECT')
-            for attr in self.target_object.data.attributes:
-                if attr.name.startswith("ND.") and attr.domain == 'EDGE':
-                    print(f"Removing attribute {attr.name} from {self.target_object.name}")
-                    self.target_object.data.attributes.remove(attr)
-            bpy.ops.object.mode_set(mode='EDIT')
+            remove_nd_edge_attributes(self.target_object.data)
 
             return {'FINISHED'}
 
@@ -229,39 +225,30 @@ Min Blender Version: """ + '.'.join([str(v) for v in MIN_BLENDER_VERSION])
         self.percentage_input_stream = new_stream()
         self.profile_input_stream = new_stream()
 
-        self.edge_attribute = None
         self.edge_attribute_name = None
 
         previous_op = False
 
-        self.bm = bmesh.from_edit_mesh(self.target_object.data)
-        self.bm.edges.ensure_lookup_table()
-        self.selected_edges_indexes = [edge.index for edge in self.bm.edges if edge.select]
-        self.bm.free()
-
-        bpy.ops.object.mode_set(mode='OBJECT')
+        bm = bmesh.from_edit_mesh(self.target_object.data)
+        self.selected_edges_indexes = numpy.array([edge.index for edge in bm.edges if edge.select], dtype=numpy.int32)
 
+        mesh = self.target_object.data
         attribute_matches = []
-        for attr in self.target_object.data.attributes:
-            if attr.name.startswith("ND.") and attr.domain == 'EDGE':
-                if any(attr.data[edge].value > 0 for edge in self.selected_edges_indexes):
-                    attribute_matches.append(attr)
-
-        bpy.ops.object.mode_set(mode='EDIT')
+        for name in get_nd_edge_attribute_names(mesh):
+            if (get_edge_attribute_values_at(mesh, name, self.selected_edges_indexes) > 0).any():
+                attribute_matches.append(name)
 
         if len(attribute_matches) > 1:
             self.report({'INFO'}, "Multiple edge attributes are active, unable to continue operation.")
             return {'CANCELLED'}
 
         if len(attribute_matches) == 1:
-            attribute_match = attribute_matches[0]
-            for mod in self.target_object.modifiers:
-                if mod.type == 'BEVEL' and mod.limit_method == 'WEIGHT' and mod.edge_weight == attribute_match.name:
-                    previous_op = True
-                    self.bevel = mod
-                    self.edge_attribute = attribute_match
-                    self.edge_attribute_name = attribute_match.name
-                    break
+            attribute_bevels = get_edge_attribute_bevels(self.target_object)
+            bevel = attribute_bevels.get(attribute_matches[0])
+            if bevel is not None:
+                previous_op = True
+                self.bevel = bevel
+                self.edge_attribute_name = attribute_matches[0]
 
         if previous_op:
             self.summon_old_operator(context)
@@ -331,43 +318,21 @@ Min Blender Version: """ + '.'.join([str(v) for v in MIN_BLENDER_VERSION])
 
         # Set the edge attribute value for all new edges selected in the
         # current summoning, and keep track of them (for reverting).
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.post_summon_new_edges = []
-        self.edge_attribute = self.target_object.data.attributes.get(self.edge_attribute_name)
-        for edge in self.selected_edges_indexes:
-            if self.edge_attribute.data[edge].value <= 0:
-                self.post_summon_new_edges.append(edge)
-                self.edge_attribute.data[edge].value = 1.0
-        bpy.ops.object.mode_set(mode='EDIT')
+        mesh = self.target_object.data
+        values = get_edge_attribute_values_at(mesh, self.edge_attribute_name, self.selected_edges_indexes)
+        self.post_summon_new_edges = self.selected_edges_indexes[values <= 0]
+        set_edge_attribute_values_at(mesh, self.edge_attribute_name, self.post_summon_new_edges, 1.0)
 
 
     def add_new_edge_attribute(self, context):
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        self.edge_attribute = self.target_object.data.attributes.new(name="ND.EdgeWeight", type='FLOAT', domain='EDGE')
-        self.edge_attribute_name = self.edge_attribute.name
-
-        for edge in self.selected_edges_indexes:
-            self.edge_attribute.data[edge].value = 1.0
-
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.edge_attribute_name = new_edge_attribute(self.target_object.data, "ND.EdgeWeight", self.selected_edges_indexes)
 
 
     def add_smooth_shading(self, context):
         if not get_preferences().enable_auto_smooth:
             return
 
-        if app_minor_version() >= (4, 1):
-            bpy.ops.object.mode_set(mode='OBJECT')
-            add_smooth_by_angle(context, self.target_object)
-            bpy.ops.object.mode_set(mode='EDIT')
-            return
-
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.shade_smooth()
-        self.target_object.data.use_auto_smooth = True
-        self.target_object.data.auto_smooth_angle = radians(float(get_preferences().default_smoothing_angle))
-        bpy.ops.object.mode_set(mode='EDIT')
+        add_smooth_shading(context, self.target_object)
 
 
     def add_bevel_modifier(self, context):
@@ -389,12 +354,10 @@ Min Blender Version: """ + '.'.join([str(v) for v in MIN_BLENDER_VERSION])
                 break
 
         if has_previous_weld:
-            while self.target_object.modifiers[previous_weld_index].name != self.bevel.name:
-                bpy.ops.object.modifier_move_up(modifier=self.bevel.name)
+            move_mod_to_index(self.target_object, self.bevel.name, previous_weld_index)
 
         if not has_previous_weld and self.early_apply:
-            while self.target_object.modifiers[0].name != self.bevel.name:
-                bpy.ops.object.modifier_move_up(modifier=self.bevel.name)
+            move_mod_to_index(self.target_object, self.bevel.name, 0)
 
 
     def add_weld_modifier(self, context):
@@ -410,8 +373,7 @@ Min Blender Version: """ + '.'.join([str(v) for v in MIN_BLENDER_VERSION])
             self.weld = weld
 
             if self.early_apply:
-                while self.target_object.modifiers[1].name != self.weld.name:
-                    bpy.ops.object.modifier_move_up(modifier=self.weld.name)
+                move_mod_to_index(self.target_object, self.weld.name, 1)
 
 
     def is_width_percent(self):
@@ -458,11 +420,7 @@ Min Blender Version: """ + '.'.join([str(v) for v in MIN_BLENDER_VERSION])
             self.bevel.loop_slide = self.loop_slide_prev
             self.bevel.use_clamp_overlap = self.clamp_overlap_prev
 
-            bpy.ops.object.mode_set(mode='OBJECT')
-            self.edge_attribute = self.target_object.data.attributes.get(self.edge_attribute_name)
-            for edge in self.post_summon_new_edges:
-                self.edge_attribute.data[edge].value = 0.0
-            bpy.ops.object.mode_set(mode='EDIT')
+            set_edge_attribute_values_at(self.target_object.data, self.edge_attribute_name, self.post_summon_new_edges, 0.0)
 
         unregister_draw_handler()
 
@@ -27,14 +27,14 @@
 
 import bpy
 import bmesh
-from math import radians
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream, set_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with, ensure_tail_mod_consistency, add_smooth_by_angle
+from .. lib.modifiers import new_modifier, move_mod_to_index, remove_modifiers_ending_with, ensure_tail_mod_consistency, add_smooth_shading
 from .. lib.polling import ctx_edit_mode, obj_is_mesh, obj_verts_selected, app_minor_version
+from .. lib.vertex_groups import build_vertex_group_index, get_vertex_group_members, get_vertex_groups_touching, set_vertex_group_weights, remove_from_vertex_groups
 from .. lib.math import round_dec
 
 
@@ -62,6 +62,7 @@ CTRL — Remove existing modifiers"""
         'MOVEMENT_PASSTHROUGH': True,
         'ON_CANCEL': lambda cls, context: cls.revert(context),
         'ON_CONFIRM': lambda cls, context: cls.finish(context),
+        'OPERATE_INTERVAL': 1 / 30,
     }
 
 
@@ -150,7 +151,7 @@ CTRL — Remove existing modifiers"""
                 self.percentage = max(0, round_dec(self.percentage - percent_factor))
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.segments_input_stream) and self.key_alt and self.has_mouse_step:
                 self.segments = max(1, self.segments + self.mouse_step)
                 self.mark_dirty()
@@ -212,30 +213,27 @@ CTRL — Remove existing modifiers"""
         bm = bmesh.from_edit_mesh(self.target_object.data)
         bm.verts.ensure_lookup_table()
         self.selected_vert_indices = [vert.index for vert in bm.verts if vert.select]
+        vgroup_index = build_vertex_group_index(self.target_object, bm)
         bm.free()
 
         self.vgroup_match = None
-        for group in self.target_object.vertex_groups:
-            vgroup_vert_indices = [vert.index for vert in self.target_object.data.vertices if group.index in [i.group for i in vert.groups]]
-            if len(set(vgroup_vert_indices) & set(self.selected_vert_indices)) > 0:
-                if self.vgroup_match:
-                    self.report({'INFO'}, "Multiple vertex groups selected, unable to continue operation.")
-                    return {'CANCELLED'}
-                self.vgroup_match = (group, vgroup_vert_indices)
+        matching_groups = get_vertex_groups_touching(vgroup_index, self.selected_vert_indices)
+        if len(matching_groups) > 1:
+            self.report({'INFO'}, "Multiple vertex groups selected, unable to continue operation.")
+            return {'CANCELLED'}
 
-        self.vertex_group_weight_previous = bpy.context.scene.tool_settings.vertex_group_weight
-        bpy.context.scene.tool_settings.vertex_group_weight = 1.0
+        if matching_groups:
+            group = self.target_object.vertex_groups[matching_groups[0]]
+            self.vgroup_match = (group, get_vertex_group_members(vgroup_index, group.index).tolist())
 
         if self.vgroup_match:
             group, vgroup_vert_indices = self.vgroup_match
 
             self.group = group
-            self.vgroup_difference = [i for i in self.selected_vert_indices if i not in vgroup_vert_indices]
+            vgroup_vert_set = set(vgroup_vert_indices)
+            self.vgroup_difference = [i for i in self.selected_vert_indices if i not in vgroup_vert_set]
 
-            bpy.ops.object.mode_set(mode='OBJECT')
-            self.group.add(self.vgroup_difference, 1.0, 'ADD')
-            self.group.add(vgroup_vert_indices, 1.0, 'REPLACE')
-            bpy.ops.object.mode_set(mode='EDIT')
+            set_vertex_group_weights(self.target_object, self.group, vgroup_vert_indices + self.vgroup_difference, 1.0)
 
             bpy.ops.mesh.select_all(action='DESELECT')
             bpy.ops.object.vertex_group_set_active(group=self.group.name)
@@ -307,26 +305,12 @@ CTRL — Remove existing modifiers"""
         if not get_preferences().enable_auto_smooth:
             return
 
-        if app_minor_version() >= (4, 1):
-            bpy.ops.object.mode_set(mode='OBJECT')
-            add_smooth_by_angle(context, self.target_object)
-            bpy.ops.object.mode_set(mode='EDIT')
-            return
-
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.shade_smooth()
-        self.target_object.data.use_auto_smooth = True
-        self.target_object.data.auto_smooth_angle = radians(float(get_preferences().default_smoothing_angle))
-        bpy.ops.object.mode_set(mode='EDIT')
+        add_smooth_shading(context, self.target_object)
 
 
     def add_vertex_group(self, context):
         vgroup = self.target_object.vertex_groups.new(name="ND — Bevel")
-        bpy.ops.object.vertex_group_assign()
-
-        bpy.ops.object.mode_set(mode='OBJECT')
-        vgroup.add(self.selected_vert_indices, 1.0, 'REPLACE')
-        bpy.ops.object.mode_set(mode='EDIT')
+        set_vertex_group_weights(self.target_object, vgroup, self.selected_vert_indices, 1.0)
 
         self.vgroup = vgroup
 
@@ -341,8 +325,7 @@ CTRL — Remove existing modifiers"""
         self.bevel = bevel
 
         if not self.late_apply:
-            while self.target_object.modifiers[0].name != self.bevel.name:
-                bpy.ops.object.modifier_move_up(modifier=self.bevel.name)
+            move_mod_to_index(self.target_object, self.bevel.name, 0)
 
 
     def add_weld_modifier(self, context):
@@ -358,8 +341,7 @@ CTRL — Remove existing modifiers"""
             self.weld = weld
 
             if not self.late_apply:
-                while self.target_object.modifiers[1].name != self.weld.name:
-                    bpy.ops.object.modifier_move_up(modifier=self.weld.name)
+                move_mod_to_index(self.target_object, self.weld.name, 1)
 
 
     def operate(self, context):
@@ -380,13 +362,10 @@ CTRL — Remove existing modifiers"""
 
         ensure_tail_mod_consistency(self.target_object)
 
-        # TODO: Find a better solution. This is a workaround for the fact that
-        # the vertex group <> modifier combo's are not being detected by the recall
-        # algorithm directly after they've been created while in edit mode.
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.mode_set(mode='EDIT')
-
-        bpy.context.scene.tool_settings.vertex_group_weight = self.vertex_group_weight_previous
+        # The vertex group weights were written to the edit-mode bmesh, so flush them to the
+        # mesh for anything reading mesh.vertices[].groups (rather than the deform layer)
+        # before edit mode is left, such as recall straight after the group is created.
+        self.target_object.update_from_editmode()
 
         unregister_draw_handler()
 
@@ -403,16 +382,12 @@ CTRL — Remove existing modifiers"""
             self.bevel.profile = self.profile_prev
 
             if self.vgroup_match:
-                bpy.ops.object.mode_set(mode='OBJECT')
-                self.group.remove(self.vgroup_difference)
-                bpy.ops.object.mode_set(mode='EDIT')
+                remove_from_vertex_groups(self.target_object, self.vgroup_difference, [self.group])
 
         if not self.summoned:
             bpy.ops.object.modifier_remove(modifier=self.bevel.name)
             self.target_object.vertex_groups.remove(self.vgroup)
 
-        bpy.context.scene.tool_settings.vertex_group_weight = self.vertex_group_weight_previous
-
         unregister_draw_handler()
 
 
@@ -33,7 +33,7 @@ from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, tog
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream
-from .. lib.modifiers import new_modifier, remove_problematic_boolean_mods, ensure_tail_mod_consistency
+from .. lib.modifiers import new_modifier, remove_problematic_boolean_mods, ensure_tail_mod_consistency, begin_boolean_preview, end_boolean_preview
 from .. lib.objects import get_real_active_object, configure_object_as_util, get_objects_in_hierarchy
 from .. lib.polling import obj_exists, objs_are_mesh, ctx_objects_selected, ctx_obj_mode, app_minor_version
 from .. lib.math import round_dec
@@ -87,7 +87,7 @@ class ND_OT_bool_inset(BaseOperator):
                 self.thickness = max(0, round_dec(self.thickness - self.step_size))
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.thickness_input_stream) and self.key_no_modifiers:
                 self.thickness = max(0, self.thickness + self.mouse_value)
                 self.mark_dirty()
@@ -137,6 +137,10 @@ class ND_OT_bool_inset(BaseOperator):
             self.boolean_isect.material_mode = 'TRANSFER'
         self.boolean_isect.show_expanded = False
 
+        self.boolean_preview = []
+        if get_preferences().use_fast_boolean_previews:
+            self.boolean_preview = begin_boolean_preview([self.boolean_diff, self.boolean_isect])
+
         self.reference_obj_name_prev = self.reference_obj.name
 
         configure_object_as_util(self.reference_obj, util=True)
@@ -192,6 +196,8 @@ class ND_OT_bool_inset(BaseOperator):
 
 
     def finish(self, context):
+        end_boolean_preview(self.boolean_preview)
+
         unhide_obj(self.reference_obj)
 
         bpy.ops.object.select_all(action='DESELECT')
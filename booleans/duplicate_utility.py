@@ -26,10 +26,10 @@
 # ---
 
 import bpy
-import inspect
 from .. lib.objects import get_real_active_object
 from .. lib.polling import ctx_obj_mode, ctx_objects_selected
-from .. lib.modifiers import move_mod_to_index
+from .. lib.modifiers import move_mod_to_index, get_modifier_schema, copy_modifier_properties
+from .. lib.references import get_util_references
 
 
 class ND_OT_duplicate_utility(bpy.types.Operator):
@@ -59,22 +59,18 @@ ALT — Create a linked duplicate"""
 
         new_utility_object = context.active_object
 
-        targets = []
-        all_scene_objects = [obj for obj in bpy.context.view_layer.objects if obj.type == 'MESH']
+        targets = {}
+        view_layer_objects = context.view_layer.objects
 
         # Get all objects with boolean modifiers that reference the utility object
-        for obj in all_scene_objects:
-            if obj == old_utility_object:
+        for obj, mod in get_util_references(old_utility_object):
+            if obj == old_utility_object or obj.type != 'MESH' or obj.name not in view_layer_objects:
                 continue
 
-            obj_mods = list(obj.modifiers)
-            applicable_mods = []
-            for index, mod in enumerate(obj_mods):
-                if mod.type == 'BOOLEAN' and mod.object == old_utility_object:
-                    applicable_mods.append((mod, index))
+            if mod.type == 'BOOLEAN' and mod.object == old_utility_object:
+                targets.setdefault(obj, []).append((mod, obj.modifiers.find(mod.name)))
 
-            if len(applicable_mods) > 0:
-                targets.append((obj, applicable_mods))
+        targets = [(obj, sorted(applicable_mods, key=lambda m: m[1])) for obj, applicable_mods in targets.items()]
 
         for obj, applicable_mods in targets:
             for old_mod, old_mod_index in applicable_mods:
@@ -89,12 +85,7 @@ ALT — Create a linked duplicate"""
 
                 # Create a new boolean modifier with the same properties as the old one.
                 new_mod = obj.modifiers.new(old_mod.name, 'BOOLEAN')
-                old_mod_props = inspect.getmembers(old_mod, lambda a: not(inspect.isroutine(a)))
-                for prop in old_mod_props:
-                    try:
-                        setattr(new_mod, prop[0], prop[1])
-                    except:
-                        pass
+                copy_modifier_properties(old_mod, new_mod, get_modifier_schema(old_mod)['writable'])
 
                 new_mod.object = new_utility_object
                 move_mod_to_index(obj, new_mod.name, old_mod_index+1)
@@ -30,7 +30,6 @@ import bmesh
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
-from .. lib.preferences import get_preferences
 from .. lib.polling import ctx_obj_mode, list_ok, app_minor_version
 from .. lib.objects import configure_object_as_util
 
@@ -70,7 +69,7 @@ class ND_OT_hydrate(BaseOperator):
                 self.active_collection = (self.active_collection - 1) % len(self.scene_collections)
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if self.key_no_modifiers and self.has_mouse_step:
                 self.active_collection = (self.active_collection + self.mouse_step) % len(self.scene_collections)
                 self.mark_dirty()
@@ -31,6 +31,7 @@ from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.polling import ctx_obj_mode, list_ok, app_minor_version, obj_moddable
+from .. lib.references import get_util_references
 
 
 class ND_OT_swap_solver(BaseOperator):
@@ -68,15 +69,9 @@ class ND_OT_swap_solver(BaseOperator):
         if app_minor_version() >= (5, 0):
             self.solver_options[0] = 'FLOAT'
 
-        all_scene_objects = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-        mesh_object_names = [obj.name for obj in context.selected_objects if obj.type == 'MESH']
-        fast_solver_count = 0
-        exact_solver_count = 0
-
-        for obj in all_scene_objects:
-            mods = [mod for mod in obj.modifiers if mod.type == 'BOOLEAN']
-            for mod in mods:
-                if mod.object and mod.object.name in mesh_object_names:
+        for util in [obj for obj in context.selected_objects if obj.type == 'MESH']:
+            for owner, mod in get_util_references(util):
+                if owner.type == 'MESH' and mod.type == 'BOOLEAN' and mod.object == util:
                     self.boolean_mods.add(mod)
 
         for obj in context.selected_objects:
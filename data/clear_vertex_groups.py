@@ -28,6 +28,7 @@
 import bpy
 import bmesh
 from .. lib.objects import get_real_active_object
+from .. lib.vertex_groups import build_vertex_group_index, is_vertex_group_empty, remove_from_vertex_groups
 from .. lib.polling import ctx_edit_mode, ctx_obj_mode, ctx_min_objects_selected, objs_are_mesh, obj_is_mesh, obj_verts_selected
 
 
@@ -68,22 +69,18 @@ SHIFT — Do not remove empty vertex groups"""
         # If we're in edit mode, only remove the selected vertices from groups their in
         # ...
 
-        bm = bmesh.from_edit_mesh(context.active_object.data)
-        bm.verts.ensure_lookup_table()
-        selected_vert_indices = [vert.index for vert in bm.verts if vert.select]
-        bm.free()
+        obj = context.active_object
 
-        bpy.ops.object.mode_set(mode='OBJECT')
+        bm = bmesh.from_edit_mesh(obj.data)
+        selected_vert_indices = [vert.index for vert in bm.verts if vert.select]
 
-        for vg in context.active_object.vertex_groups:
-            vg.remove(selected_vert_indices)
+        remove_from_vertex_groups(obj, selected_vert_indices)
 
         if self.remove_empty_vertex_groups:
-            for vg in context.active_object.vertex_groups:
-                if self.is_vertex_group_empty(context.active_object, vg.name):
-                    context.active_object.vertex_groups.remove(vg)
-
-        bpy.ops.object.mode_set(mode='EDIT')
+            vgroup_index = build_vertex_group_index(obj, bm)
+            empty_groups = [vg for vg in obj.vertex_groups if is_vertex_group_empty(vgroup_index, vg.index)]
+            for vg in empty_groups:
+                obj.vertex_groups.remove(vg)
 
         return {'FINISHED'}
 
@@ -96,21 +93,6 @@ SHIFT — Do not remove empty vertex groups"""
         return self.execute(context)
 
 
-    def is_vertex_group_empty(self, obj, group_name):
-        if group_name not in obj.vertex_groups:
-            return True  # Group doesn't exist, so it's "empty"
-
-        group = obj.vertex_groups[group_name]
-
-        # Check if any vertex has weight > 0 for this group
-        for vertex in obj.data.vertices:
-            for group_element in vertex.groups:
-                if group_element.group == group.index and group_element.weight > 0:
-                    return False
-
-        return True
-
-
 def register():
     bpy.utils.register_class(ND_OT_clear_vertex_groups)
 
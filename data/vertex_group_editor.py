@@ -32,7 +32,7 @@ from math import radians
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import init_overlay, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
-from .. lib.preferences import get_preferences, get_scene_unit_factor
+from .. lib.preferences import get_scene_unit_factor
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream, set_stream
 from .. lib.objects import get_real_active_object
 from .. lib.polling import ctx_edit_mode, obj_is_mesh, ctx_objects_selected, app_minor_version
@@ -99,7 +99,7 @@ class ND_OT_vertex_group_editor(BaseOperator):
                 self.weight = max(self.weight - weight_factor, 0.0)
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.weight_input_stream) and self.key_no_modifiers:
                 self.weight = max(0, min(1, self.weight + self.mouse_value))
                 self.mark_dirty()
@@ -26,12 +26,11 @@
 # ---
 
 import bpy
-import bmesh
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
-from .. lib.math import generate_bounding_box, v3_average
+from .. lib.bounds import get_bounds, get_bounds_center, get_bounds_size
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream, set_stream
 from .. lib.modifiers import new_modifier, remove_modifiers_ending_with, ensure_tail_mod_consistency
 from .. lib.objects import get_real_active_object
@@ -151,7 +150,7 @@ CTRL — Remove existing modifiers"""
                     self.lattice_points_w = max(2, self.lattice_points_w - 1)
                     self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.lattice_points_u_input_stream) and self.uniform and self.has_mouse_step:
                 self.lattice_points_u = max(2, self.lattice_points_u + self.mouse_step)
                 self.lattice_points_v = self.lattice_points_u
@@ -283,42 +282,28 @@ CTRL — Remove existing modifiers"""
 
 
     def add_lattice_object(self, context):
-        bpy.ops.object.duplicate()
-
         depsgraph = context.evaluated_depsgraph_get()
-        object_eval = context.active_object.evaluated_get(depsgraph)
-        context.active_object.modifiers.clear()
-
-        bm = bmesh.new()
-        bm.from_mesh(object_eval.data)
-        bm.to_mesh(context.active_object.data)
-        bm.free()
-
-        eval_obj = context.active_object
-
-        coords = [vert for vert in eval_obj.data.vertices]
-        box = generate_bounding_box(coords)
-        center = v3_average(box)
+        bounds = get_bounds(self.target_object, depsgraph)
+        center = get_bounds_center(bounds)
+        dimensions = get_bounds_size(bounds) * self.target_object.matrix_world.to_scale()
 
         bpy.ops.object.add(type='LATTICE', enter_editmode=False, align='WORLD', location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1))
 
-        context.active_object.location = eval_obj.matrix_world @ center
-        context.active_object.rotation_euler = eval_obj.rotation_euler
+        context.active_object.location = self.target_object.matrix_world @ center
+        context.active_object.rotation_euler = self.target_object.rotation_euler
         context.active_object.name = "Lattice"
         context.active_object.data.name = "Lattice"
         context.active_object.data.use_outside = True
 
         if app_minor_version() >= (4, 1):
-            context.active_object.scale = eval_obj.dimensions * 1.001
+            context.active_object.scale = dimensions * 1.001
         else:
-            context.active_object.dimensions = eval_obj.dimensions * 1.001
+            context.active_object.dimensions = dimensions * 1.001
 
         self.lattice_obj = context.active_object
         self.lattice_obj.parent = self.target_object
         self.lattice_obj.matrix_parent_inverse = self.target_object.matrix_world.inverted()
 
-        bpy.data.meshes.remove(eval_obj.data, do_unlink=True)
-
 
     def select_reference_object(self, context):
         bpy.ops.object.select_all(action='DESELECT')
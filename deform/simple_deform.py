@@ -61,6 +61,7 @@ CTRL — Remove existing modifiers"""
         'MOVEMENT_PASSTHROUGH': True,
         'ON_CANCEL': lambda cls, context: cls.revert(context),
         'ON_CONFIRM': lambda cls, context: cls.finish(context),
+        'OPERATE_INTERVAL': 1 / 30,
     }
 
 
@@ -116,7 +117,7 @@ CTRL — Remove existing modifiers"""
 
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if self.key_no_modifiers:
                 if no_stream(self.angle_input_stream) and self.is_angular[self.methods[self.current_method]]:
                     self.angle = max(-360, min(360, self.angle + self.mouse_value_mag))
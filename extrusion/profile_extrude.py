@@ -27,14 +27,13 @@
 
 import bpy
 import bmesh
-from math import radians
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.axis import init_axis, register_axis_handler, unregister_axis_handler
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream, set_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with, ensure_tail_mod_consistency, add_smooth_by_angle
+from .. lib.modifiers import new_modifier, remove_modifiers_ending_with, ensure_tail_mod_consistency, add_smooth_shading
 from .. lib.objects import get_real_active_object
 from .. lib.polling import ctx_obj_mode, ctx_edit_mode, obj_is_mesh, ctx_objects_selected, app_minor_version
 from .. lib.math import round_dec
@@ -115,7 +114,7 @@ CTRL — Remove existing modifiers"""
                 self.offset = round_dec(self.offset - self.step_size)
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.extrusion_length_input_stream) and self.key_no_modifiers:
                 self.extrusion_length = max(0, self.extrusion_length + self.mouse_value)
                 self.mark_dirty()
@@ -233,23 +232,7 @@ CTRL — Remove existing modifiers"""
         if not get_preferences().enable_auto_smooth:
             return
 
-        return_to_edit = False
-        if self.edit_mode:
-            bpy.ops.object.mode_set(mode='OBJECT')
-            return_to_edit = True
-
-        if app_minor_version() >= (4, 1):
-            add_smooth_by_angle(context, self.target_object)
-            if return_to_edit:
-                bpy.ops.object.mode_set(mode='EDIT')
-            return
-
-        bpy.ops.object.shade_smooth()
-        self.target_object.data.use_auto_smooth = True
-        self.target_object.data.auto_smooth_angle = radians(float(get_preferences().default_smoothing_angle))
-
-        if return_to_edit:
-            bpy.ops.object.mode_set(mode='EDIT')
+        add_smooth_shading(context, self.target_object)
 
 
     def add_weighting_modifier(self, context):
@@ -34,7 +34,7 @@ from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.axis import init_axis, register_axis_handler, unregister_axis_handler
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream, set_stream
-from .. lib.modifiers import new_modifier, remove_modifiers_ending_with, add_smooth_by_angle, ensure_tail_mod_consistency
+from .. lib.modifiers import new_modifier, remove_modifiers_ending_with, add_smooth_shading, ensure_tail_mod_consistency
 from .. lib.objects import get_real_active_object
 from .. lib.polling import ctx_obj_mode, ctx_edit_mode, obj_moddable, ctx_objects_selected, app_minor_version
 from .. lib.math import round_dec
@@ -63,6 +63,7 @@ CTRL — Remove existing modifiers"""
         'MOVEMENT_PASSTHROUGH': True,
         'ON_CANCEL': lambda cls, context: cls.revert(context),
         'ON_CONFIRM': lambda cls, context: cls.finish(context),
+        'OPERATE_INTERVAL': 1 / 30,
     }
 
 
@@ -133,7 +134,7 @@ CTRL — Remove existing modifiers"""
                 self.segments = max(3, self.segments - segment_factor)
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.offset_input_stream) and self.key_ctrl:
                 self.offset += self.mouse_value
                 self.mark_dirty()
@@ -250,23 +251,7 @@ CTRL — Remove existing modifiers"""
         if not get_preferences().enable_auto_smooth:
             return
 
-        return_to_edit = False
-        if self.edit_mode:
-            bpy.ops.object.mode_set(mode='OBJECT')
-            return_to_edit = True
-
-        if app_minor_version() >= (4, 1):
-            add_smooth_by_angle(context, self.target_object)
-            if return_to_edit:
-                bpy.ops.object.mode_set(mode='EDIT')
-            return
-
-        bpy.ops.object.shade_smooth()
-        self.target_object.data.use_auto_smooth = True
-        self.target_object.data.auto_smooth_angle = radians(float(get_preferences().default_smoothing_angle))
-
-        if return_to_edit:
-            bpy.ops.object.mode_set(mode='EDIT')
+        add_smooth_shading(context, self.target_object)
 
 
     def add_displace_modifier(self, context):
@@ -60,6 +60,7 @@ CTRL — Remove existing modifiers"""
         'MOVEMENT_PASSTHROUGH': True,
         'ON_CANCEL': lambda cls, context: cls.revert(context),
         'ON_CONFIRM': lambda cls, context: cls.finish(context),
+        'OPERATE_INTERVAL': 1 / 30,
     }
 
 
@@ -108,7 +109,7 @@ CTRL — Remove existing modifiers"""
                 self.offset = round_dec(self.offset - self.step_size)
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.thickness_input_stream) and self.key_no_modifiers:
                 self.thickness = max(0, self.thickness + self.mouse_value)
                 self.mark_dirty()
@@ -26,9 +26,9 @@
 # ---
 
 import bpy
-import bmesh
 from .. __init__ import bl_info
-from .. lib.objects import is_planar, get_real_active_object
+from .. lib.objects import get_real_active_object
+from .. lib.topology import get_topology
 from . ops import build_icon_lookup_table
 from .. lib.addons import is_addon_enabled
 from .. lib.polling import ctx_edit_mode
@@ -184,21 +184,13 @@ class ND_MT_fast_menu(bpy.types.Menu):
             return NO_SECTION_COUNT
 
         depsgraph = context.evaluated_depsgraph_get()
-        object_eval = target_object.evaluated_get(depsgraph)
+        topology = get_topology(target_object, depsgraph)
 
-        bm = bmesh.new()
-        bm.from_mesh(object_eval.data)
-
-        self.verts = [vert for vert in bm.verts]
-        self.edges = [edge for edge in bm.edges]
-        self.faces = [face for face in bm.faces]
-        self.sketch = len(self.faces) >= 1 and is_planar(bm)
-        self.profile = len(self.faces) == 0 and len(self.edges) > 0
-        self.has_faces = len(self.faces) >= 1
-        self.manifold = all([len(edge.link_faces) == 2 for edge in self.edges])
-        self.has_loose_edges = any([len(edge.link_faces) == 0 for edge in self.edges])
-
-        bm.free()
+        self.sketch = topology['sketch']
+        self.profile = topology['profile']
+        self.has_faces = topology['has_faces']
+        self.manifold = topology['manifold']
+        self.has_loose_edges = topology['has_loose_edges']
 
         mod_names = [mod.name for mod in target_object.modifiers]
 
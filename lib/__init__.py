@@ -43,6 +43,15 @@ from . import numeric_input
 from . import overlay_keys
 from . import base_operator
 from . import polling
+from . import attributes
+from . import snapping
+from . import raycast
+from . import references
+from . import sync
+from . import topology
+from . import vertex_groups
+from . import bounds
+from . import handlers
 
 
 registerables = (
@@ -63,6 +72,15 @@ registerables = (
     overlay_keys,
     base_operator,
     polling,
+    attributes,
+    snapping,
+    raycast,
+    references,
+    sync,
+    topology,
+    vertex_groups,
+    bounds,
+    handlers,
 )
 
 
@@ -33,6 +33,10 @@ def is_extension():
 
 
 def get_registered_addon_name():
+    return registered_addon_name
+
+
+def resolve_registered_addon_name():
     if is_extension():
         path = __name__.split('.')
         extension = path[0:3]
@@ -42,6 +46,9 @@ def get_registered_addon_name():
     return path[0]
 
 
+registered_addon_name = resolve_registered_addon_name()
+
+
 def is_addon_enabled(addon):
     for key in bpy.context.preferences.addons.keys():
         if addon == key:
@@ -0,0 +1,229 @@
+# ███╗   ██╗██████╗
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝
+#
+# ND (Non-Destructive) Blender Add-on
+# Copyright (C) 2024 Tristan S. & Ian J. (HugeMenace)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+import bmesh
+from . lazy import numpy
+from . polling import app_minor_version
+
+
+def clear_bevel_weights(mesh):
+    if app_minor_version() < (4, 0):
+        mesh.edges.foreach_set("bevel_weight", numpy.zeros(len(mesh.edges), dtype=numpy.float32))
+        return
+
+    # From Blender 4.0 onwards, bevel weights are a regular attribute which
+    # defaults to zero, so dropping it is the same as clearing every value.
+    attr = mesh.attributes.get("bevel_weight_edge")
+    if attr is not None:
+        mesh.attributes.remove(attr)
+
+
+def get_nd_edge_attribute_names(mesh):
+    return [attr.name for attr in mesh.attributes if attr.domain == 'EDGE' and attr.name.startswith("ND.")]
+
+
+def remove_nd_edge_attributes(mesh, keep=()):
+    for name in get_nd_edge_attribute_names(mesh):
+        if name in keep:
+            continue
+
+        mesh.attributes.remove(mesh.attributes[name])
+
+
+def get_edge_attribute_values(mesh, name):
+    values = numpy.empty(len(mesh.edges), dtype=numpy.float32)
+    mesh.attributes[name].data.foreach_get("value", values)
+
+    return values
+
+
+def set_edge_attribute_values(mesh, name, values):
+    mesh.attributes[name].data.foreach_set("value", numpy.asarray(values, dtype=numpy.float32))
+    mesh.update()
+
+
+# While a mesh is in edit mode the edit-mode bmesh owns its data, so the helpers below
+# read & write the bmesh layers directly there (no mode switching required), and fall
+# back to the bulk mesh attribute API in object mode.
+def get_edge_attribute_values_at(mesh, name, edge_indices):
+    edge_indices = numpy.asarray(edge_indices, dtype=numpy.int32)
+
+    if not mesh.is_editmode:
+        return get_edge_attribute_values(mesh, name)[edge_indices]
+
+    bm = bmesh.from_edit_mesh(mesh)
+    bm.edges.ensure_lookup_table()
+    layer = bm.edges.layers.float[name]
+
+    return numpy.array([bm.edges[i][layer] for i in edge_indices.tolist()], dtype=numpy.float32)
+
+
+def set_edge_attribute_values_at(mesh, name, edge_indices, value):
+    edge_indices = numpy.asarray(edge_indices, dtype=numpy.int32)
+
+    if not mesh.is_editmode:
+        values = get_edge_attribute_values(mesh, name)
+        values[edge_indices] = value
+        set_edge_attribute_values(mesh, name, values)
+        return
+
+    bm = bmesh.from_edit_mesh(mesh)
+    bm.edges.ensure_lookup_table()
+    layer = bm.edges.layers.float[name]
+
+    for i in edge_indices.tolist():
+        bm.edges[i][layer] = value
+
+    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+
+
+def new_edge_attribute(mesh, name, edge_indices, value=1.0):
+    # The attribute API resolves name clashes (and supports edit mode), so the
+    # final name is returned for the caller to reference.
+    name = mesh.attributes.new(name=name, type='FLOAT', domain='EDGE').name
+    set_edge_attribute_values_at(mesh, name, edge_indices, value)
+
+    return name
+
+
+def set_mesh_smooth(mesh):
+    if not mesh.is_editmode:
+        mesh.polygons.foreach_set("use_smooth", numpy.ones(len(mesh.polygons), dtype=bool))
+        mesh.update()
+        return
+
+    bm = bmesh.from_edit_mesh(mesh)
+    for face in bm.faces:
+        face.smooth = True
+
+    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+
+
+def get_edge_attribute_bevels(object):
+    # Map of edge attribute name -> the bevel modifier driven by that attribute.
+    attribute_bevels = {}
+    for mod in object.modifiers:
+        if mod.type == 'BEVEL' and mod.limit_method == 'WEIGHT' and mod.edge_weight and mod.edge_weight not in attribute_bevels:
+            attribute_bevels[mod.edge_weight] = mod
+
+    return attribute_bevels
+
+
+def get_edge_face_angles(mesh):
+    # Angle between the two face normals of every manifold edge (-1 for all other edges),
+    # matching the edges considered by bpy.ops.mesh.edges_select_sharp.
+    edge_count = len(mesh.edges)
+    angles = numpy.full(edge_count, -1.0, dtype=numpy.float32)
+
+    if edge_count == 0 or len(mesh.polygons) == 0:
+        return angles
+
+    normals = numpy.empty(len(mesh.polygons) * 3, dtype=numpy.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    normals = normals.reshape(-1, 3)
+
+    loop_starts = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    loop_totals = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    polygon_order = numpy.argsort(loop_starts, kind='stable')
+    loop_polygons = numpy.repeat(polygon_order, loop_totals[polygon_order])
+
+    loop_edges = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    counts = numpy.bincount(loop_edges, minlength=edge_count)
+    loop_order = numpy.argsort(loop_edges, kind='stable')
+    starts = numpy.concatenate(([0], numpy.cumsum(counts)[:-1]))
+
+    manifold = numpy.flatnonzero(counts == 2)
+    face_a = loop_polygons[loop_order[starts[manifold]]]
+    face_b = loop_polygons[loop_order[starts[manifold] + 1]]
+
+    dots = numpy.einsum('ij,ij->i', normals[face_a], normals[face_b])
+    angles[manifold] = numpy.arccos(numpy.clip(dots, -1.0, 1.0))
+
+    return angles
+
+
+def get_edge_seams(mesh):
+    values = numpy.empty(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get("use_seam", values)
+
+    return values
+
+
+def set_edge_seams(mesh, values):
+    mesh.edges.foreach_set("use_seam", values)
+
+
+def get_edge_sharps(mesh):
+    values = numpy.zeros(len(mesh.edges), dtype=bool)
+
+    if app_minor_version() < (4, 0):
+        mesh.edges.foreach_get("use_edge_sharp", values)
+        return values
+
+    attr = mesh.attributes.get("sharp_edge")
+    if attr is not None:
+        attr.data.foreach_get("value", values)
+
+    return values
+
+
+def set_edge_sharps(mesh, values):
+    if app_minor_version() < (4, 0):
+        mesh.edges.foreach_set("use_edge_sharp", values)
+        return
+
+    attr = mesh.attributes.get("sharp_edge")
+
+    if attr is None and not values.any():
+        return
+
+    if attr is None:
+        attr = mesh.attributes.new("sharp_edge", 'BOOLEAN', 'EDGE')
+
+    attr.data.foreach_set("value", values)
+
+
+def get_edge_world_coords(obj):
+    mesh = obj.data
+
+    coords = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3)
+
+    matrix = numpy.array(obj.matrix_world, dtype=numpy.float32)
+    coords = coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+    edge_verts = numpy.empty(len(mesh.edges) * 2, dtype=numpy.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+
+    return coords[edge_verts.reshape(-1, 2)]
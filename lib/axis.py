@@ -121,5 +121,3 @@ def update_axis(cls):
         )
 
         batch.draw(shader)
-
-    redraw_regions()
@@ -26,7 +26,8 @@
 # ---
 
 import bpy
-from . preferences import get_scene_unit_factor, get_scene_unit_suffix, get_scene_unit_scale, get_preferences
+import time
+from . preferences import get_scene_unit_factor, get_scene_unit_suffix, get_scene_unit_scale, capture_preferences
 from .. lib.overlay import update_overlay, toggle_pin_overlay, toggle_operator_passthrough
 from .. lib.events import capture_modifier_keys, pressed
 
@@ -70,9 +71,36 @@ class BaseOperator(bpy.types.Operator):
         self.dirty = True
 
 
+    def get_operate_interval(self):
+        # Operators opt in to coalesced updates by setting 'OPERATE_INTERVAL' (in seconds)
+        # in their modal_config. Changes made within the interval are applied together.
+        return self.modal_config.get('OPERATE_INTERVAL', 0)
+
+
+    def add_operate_timer(self, context):
+        interval = self.get_operate_interval()
+        if interval <= 0:
+            return
+
+        self.operate_timer = context.window_manager.event_timer_add(interval, window=context.window)
+
+
+    def remove_operate_timer(self, context):
+        if self.operate_timer is None:
+            return
+
+        context.window_manager.event_timer_remove(self.operate_timer)
+        self.operate_timer = None
+
+
     def invoke(self, context, event):
         self.mark_dirty()
 
+        self.operate_timer = None
+        self.last_operate_time = 0
+
+        capture_preferences(self)
+
         self.unit_factor = get_scene_unit_factor()
         self.unit_suffix = get_scene_unit_suffix()
         self.unit_scale  = get_scene_unit_scale()
@@ -80,29 +108,52 @@ class BaseOperator(bpy.types.Operator):
         self.unit_scaled_factor = self.unit_factor / self.unit_scale
         self.display_unit_scale = self.unit_scale / self.unit_factor
 
-        unit_increment_size = get_preferences().unit_increment_size
+        unit_increment_size = self.prefs.unit_increment_size
         self.unit_step_hint = self.generate_step_hint(f"{(self.unit_scale * unit_increment_size):.2f}{self.unit_suffix}", f"{(self.unit_scale * 0.1 * unit_increment_size):.2f}{self.unit_suffix}")
 
-        self.extend_mouse_values = get_preferences().enable_mouse_values and get_preferences().extend_mouse_values
-        self.hard_stream_reset = get_preferences().overlay_reset_key_behaviour == 'RESET'
+        self.extend_mouse_values = self.prefs.enable_mouse_values and self.prefs.extend_mouse_values
+        self.hard_stream_reset = self.prefs.overlay_reset_key_behaviour == 'RESET'
 
-        return self.do_invoke(context, event)
+        result = self.do_invoke(context, event)
 
+        if 'RUNNING_MODAL' in result:
+            self.add_operate_timer(context)
 
-    def update_if_dirty(self, context):
+        return result
+
+
+    def update_if_dirty(self, context, force=False):
         if not self.dirty:
             return False
 
+        # Intermediate states are dropped when changes arrive faster than the operate interval,
+        # the timer event (or confirmation) that follows applies the latest values.
+        if not force and time.perf_counter() - self.last_operate_time < self.get_operate_interval():
+            return False
+
         self.operate(context)
         self.dirty = False
+        self.last_operate_time = time.perf_counter()
 
         return True
 
 
+    def end_modal(self, context, flush):
+        if flush:
+            self.update_if_dirty(context, force=True)
+
+        self.remove_operate_timer(context)
+
+
     def modal(self, context, event):
+        if self.operate_timer is not None and event.type == 'TIMER':
+            if self.update_if_dirty(context):
+                update_overlay(self, context, event, force_redraw=True)
+            return {'RUNNING_MODAL'}
+
         capture_modifier_keys(self, event)
 
-        self.step_size = ((0.1 if self.key_shift else 1) * self.unit_factor) * get_preferences().unit_increment_size
+        self.step_size = ((0.1 if self.key_shift else 1) * self.unit_factor) * self.prefs.unit_increment_size
 
         if self.key_toggle_operator_passthrough:
             toggle_operator_passthrough(self)
@@ -116,14 +167,17 @@ class BaseOperator(bpy.types.Operator):
 
         on_cancel_fn = self.modal_config.get('ON_CANCEL', None)
         if on_cancel_fn and self.key_cancel:
+            self.end_modal(context, flush=False)
             return on_cancel_fn(self, context) or {'CANCELLED'}
 
         on_confirm_alt_fn = self.modal_config.get('ON_CONFIRM_ALT', None)
         if on_confirm_alt_fn and self.key_confirm_alternative:
+            self.end_modal(context, flush=True)
             return on_confirm_alt_fn(self, context) or {'FINISHED'}
 
         on_confirm_fn = self.modal_config.get('ON_CONFIRM', None)
         if on_confirm_fn and self.key_confirm:
+            self.end_modal(context, flush=True)
             return on_confirm_fn(self, context) or {'FINISHED'}
 
         if self.modal_config.get('MOVEMENT_PASSTHROUGH', False) and self.key_movement_passthrough:
@@ -140,9 +194,14 @@ class BaseOperator(bpy.types.Operator):
         # Subclass hook-in
         return_override = self.do_modal(context, event)
 
-        self.update_if_dirty(context)
+        # Any change marked on the finishing event itself is applied before the operator ends.
+        if return_override and return_override & {'FINISHED', 'CANCELLED'}:
+            self.end_modal(context, flush=True)
+            return return_override
+
+        updated = self.update_if_dirty(context)
 
-        update_overlay(self, context, event)
+        update_overlay(self, context, event, force_redraw=updated)
 
         return return_override or {'RUNNING_MODAL'}
 
@@ -0,0 +1,85 @@
+# ███╗   ██╗██████╗
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝
+#
+# ND (Non-Destructive) Blender Add-on
+# Copyright (C) 2024 Tristan S. & Ian J. (HugeMenace)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+from mathutils import Vector
+from . lazy import numpy
+
+
+# Object space bounds of evaluated meshes, keyed by the (original) object's pointer. The
+# evaluated coordinates are read in a single bulk call, entries are dropped whenever the
+# depsgraph reports a geometry update for the object, and each entry is also checked against
+# the evaluated mesh's pointer and vertex count, as a re-evaluation may not have been reported
+# to the depsgraph handler yet.
+bounds_cache = {}
+
+
+def get_evaluated_coords(mesh):
+    coords = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float64)
+    mesh.vertices.foreach_get("co", coords)
+
+    return coords.reshape(-1, 3)
+
+
+def get_coords_bounds(coords):
+    if len(coords) == 0:
+        return (numpy.zeros(3), numpy.zeros(3))
+
+    return (coords.min(axis=0), coords.max(axis=0))
+
+
+def get_bounds(object, depsgraph):
+    # Returns the (min, max) corners of the evaluated mesh's bounds in object space,
+    # i.e. a box oriented with the object.
+    mesh = object.evaluated_get(depsgraph).data
+    signature = (mesh.as_pointer(), len(mesh.vertices))
+
+    cached = bounds_cache.get(object.as_pointer())
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    bounds = get_coords_bounds(get_evaluated_coords(mesh))
+    bounds_cache[object.as_pointer()] = (signature, bounds)
+
+    return bounds
+
+
+def get_bounds_center(bounds):
+    return Vector((bounds[0] + bounds[1]) / 2)
+
+
+def get_bounds_size(bounds):
+    return Vector(bounds[1] - bounds[0])
+
+
+def invalidate_bounds_cache(object_updates):
+    for key, object, update in object_updates:
+        if update.is_updated_geometry:
+            bounds_cache.pop(key, None)
+
+
+def clear_bounds_cache():
+    bounds_cache.clear()
@@ -27,6 +27,7 @@
 
 import bpy
 from . preferences import get_preferences
+from . references import get_object_references
 
 
 def is_util_object(obj):
@@ -70,32 +71,11 @@ def get_util_objects_for(target_objs, include_children=True):
         # 3. Check modifier references
         if hasattr(obj, 'modifiers'):
             for modifier in obj.modifiers:
-                referenced_obj = get_modifier_object_reference(modifier)
-                if referenced_obj and is_util_object(referenced_obj):
-                    util_objects.add(referenced_obj)
-                    # Recursively process the referenced object too
-                    process_object(referenced_obj)
-
-    def get_modifier_object_reference(modifier):
-        # Common object reference properties across different modifiers
-        object_properties = [
-            'object',          # Boolean, Array, Mirror, etc.
-            'target',          # Shrinkwrap, Surface Deform, etc.
-            'mirror_object',   # Mirror modifier
-            'offset_object',   # Array modifier
-            'start_cap',       # Array modifier
-            'end_cap',         # Array modifier
-            'curve_object',    # Curve modifier
-            'auxiliary_target' # Surface Deform
-        ]
-
-        for prop in object_properties:
-            if hasattr(modifier, prop):
-                obj_ref = getattr(modifier, prop)
-                if obj_ref is not None:
-                    return obj_ref
-
-        return None
+                for referenced_obj in get_object_references(modifier):
+                    if is_util_object(referenced_obj):
+                        util_objects.add(referenced_obj)
+                        # Recursively process the referenced object too
+                        process_object(referenced_obj)
 
     # Process each target object
     for target_obj in target_objs:
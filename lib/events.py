@@ -26,7 +26,7 @@
 # ---
 
 from math import copysign
-from . preferences import get_preferences
+from . preferences import get_modal_preferences
 
 
 def has(event): return event != None
@@ -36,6 +36,8 @@ def detected(event, types): return has(event) and event.type in types
 
 
 def capture_modifier_keys(cls, event=None, mouse_x=0):
+    prefs = get_modal_preferences(cls)
+
     cls.key_no_modifiers = has(event) and not event.ctrl and not event.alt
     cls.key_ctrl = has(event) and event.ctrl and not event.alt
     cls.key_shift_ctrl = has(event) and event.shift and cls.key_ctrl
@@ -54,17 +56,17 @@ def capture_modifier_keys(cls, event=None, mouse_x=0):
     cls.key_three = pressed(event, {'THREE'})
 
     cls.key_numeric_input = pressed(event, {'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN', 'EIGHT', 'NINE', 'ZERO', 'PERIOD', 'MINUS', 'NUMPAD_0', 'NUMPAD_1', 'NUMPAD_2', 'NUMPAD_3', 'NUMPAD_4', 'NUMPAD_5', 'NUMPAD_6', 'NUMPAD_7', 'NUMPAD_8', 'NUMPAD_9', 'NUMPAD_PERIOD', 'NUMPAD_MINUS', 'BACK_SPACE'})
-    cls.key_reset = pressed(event, {get_preferences().overlay_reset_key})
+    cls.key_reset = pressed(event, {prefs.overlay_reset_key})
 
-    cls.key_toggle_pin_overlay = pressed(event, {get_preferences().overlay_pin_key})
-    cls.key_toggle_operator_passthrough = pressed(event, {get_preferences().overlay_pause_key})
+    cls.key_toggle_pin_overlay = pressed(event, {prefs.overlay_pin_key})
+    cls.key_toggle_operator_passthrough = pressed(event, {prefs.overlay_pause_key})
 
     cls.key_step_up = detected(event, {'WHEELUPMOUSE'}) or pressed(event, {'UP_ARROW'}) or pressed(event, {'RIGHT_ARROW'})
     cls.key_step_down = detected(event, {'WHEELDOWNMOUSE'}) or pressed(event, {'DOWN_ARROW'}) or pressed(event, {'LEFT_ARROW'})
 
     cls.key_confirm = clicked(event, {'LEFTMOUSE'}) or pressed(event, {'SPACE', 'RET', 'NUMPAD_ENTER'})
 
-    if get_preferences().enable_right_click_select:
+    if prefs.enable_right_click_select:
         cls.key_select = detected(event, {'RIGHTMOUSE'})
         cls.key_cancel = pressed(event, {'ESC'})
     else:
@@ -77,7 +79,7 @@ def capture_modifier_keys(cls, event=None, mouse_x=0):
 
     raw_mouse_delta = 0 if event == None else (event.mouse_x - cls.prev_mouse_x)
 
-    cls.mouse_delta = raw_mouse_delta * get_preferences().mouse_value_scalar
+    cls.mouse_delta = raw_mouse_delta * prefs.mouse_value_scalar
     cls.mouse_value = cls.mouse_delta * (0.1 if cls.key_shift else 1)
     cls.prev_mouse_x = mouse_x if event == None else event.mouse_x
 
@@ -89,8 +91,8 @@ def capture_modifier_keys(cls, event=None, mouse_x=0):
         cls.mouse_travel = 0
 
     cls.prev_mouse_travel_div = 0 if event == None else cls.mouse_travel_div
-    cls.mouse_travel_div = cls.mouse_travel // get_preferences().mouse_value_steps
-    if cls.prev_mouse_travel_div != cls.mouse_travel_div and abs(cls.mouse_travel) >= get_preferences().mouse_value_steps:
+    cls.mouse_travel_div = cls.mouse_travel // prefs.mouse_value_steps
+    if cls.prev_mouse_travel_div != cls.mouse_travel_div and abs(cls.mouse_travel) >= prefs.mouse_value_steps:
         cls.mouse_step = int(1 * copysign(1, cls.mouse_travel))
     else:
         cls.mouse_step = 0
@@ -0,0 +1,93 @@
+# ███╗   ██╗██████╗
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝
+#
+# ND (Non-Destructive) Blender Add-on
+# Copyright (C) 2024 Tristan S. & Ian J. (HugeMenace)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+from bpy.app.handlers import persistent
+from . import modifiers
+from . import references
+from . import sync
+from . import topology
+from . import bounds
+from . import snapping
+from . import raycast
+
+
+# ND's caches all react to the same events, so a single set of handlers walks the depsgraph
+# updates once and hands the updated objects, as (pointer, original object, update) tuples,
+# to each cache in turn. Modules are looked up at call time so that reloads are picked up.
+@persistent
+def nd_depsgraph_update_post(scene, depsgraph):
+    object_updates = []
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            object = update.id.original
+            object_updates.append((object.as_pointer(), object, update))
+
+    if not object_updates:
+        return
+
+    modifiers.invalidate_modifier_indexes(object_updates)
+    references.update_reference_index(object_updates)
+    topology.invalidate_topology_cache(object_updates)
+    bounds.invalidate_bounds_cache(object_updates)
+    raycast.invalidate_surface_bvh_cache(object_updates)
+    sync.push_template_links(object_updates)
+
+
+def clear_caches():
+    modifiers.clear_modifier_indexes()
+    references.clear_reference_index()
+    topology.clear_topology_cache()
+    bounds.clear_bounds_cache()
+    sync.clear_template_links()
+    snapping.clear_snap_index_cache()
+    raycast.clear_surface_bvh_cache()
+
+
+@persistent
+def nd_clear_caches(_a, _b):
+    clear_caches()
+
+
+def register_handlers():
+    unregister_handlers()
+
+    bpy.app.handlers.depsgraph_update_post.append(nd_depsgraph_update_post)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(nd_clear_caches)
+
+
+def unregister_handlers():
+    # Compare by name, as reloading the module creates new function objects.
+    for handlers, name in [(bpy.app.handlers.depsgraph_update_post, "nd_depsgraph_update_post"),
+                           (bpy.app.handlers.load_post, "nd_clear_caches"),
+                           (bpy.app.handlers.undo_post, "nd_clear_caches"),
+                           (bpy.app.handlers.redo_post, "nd_clear_caches")]:
+        for handler in [h for h in handlers if getattr(h, "__name__", None) == name]:
+            handlers.remove(handler)
+
+    clear_caches()
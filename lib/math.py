@@ -67,11 +67,17 @@ def v3_sum_normalized(vectors):
 
 
 def create_rotation_matrix_from_vertex(world_matrix, vertex):
-    normal = world_matrix.to_3x3() @ vertex.normal
+    linked_coords = [edge.other_vert(vertex).co for edge in vertex.link_edges]
 
-    if vertex.link_edges:
-        longest_edge = max([edge for edge in vertex.link_edges], key=lambda x: x.calc_length())
-        binormal = (world_matrix.to_3x3() @ (longest_edge.other_vert(vertex).co - vertex.co)).normalized()
+    return create_rotation_matrix_from_vertex_coords(world_matrix, vertex.co, vertex.normal, linked_coords)
+
+
+def create_rotation_matrix_from_vertex_coords(world_matrix, co, vertex_normal, linked_coords):
+    normal = world_matrix.to_3x3() @ vertex_normal
+
+    if linked_coords:
+        longest_co = max(linked_coords, key=lambda x: (x - co).length)
+        binormal = (world_matrix.to_3x3() @ (longest_co - co)).normalized()
         tangent = binormal.cross(normal).normalized()
         binormal = normal.cross(tangent).normalized()
     else:
@@ -83,10 +89,16 @@ def create_rotation_matrix_from_vertex(world_matrix, vertex):
 
 
 def create_rotation_matrix_from_edge(world_matrix, edge):
-    binormal = (world_matrix.to_3x3() @ (edge.verts[1].co - edge.verts[0].co)).normalized()
+    face_normals = [face.normal for face in edge.link_faces]
+
+    return create_rotation_matrix_from_edge_coords(world_matrix, edge.verts[0].co, edge.verts[1].co, face_normals)
 
-    if edge.link_faces:
-        normal = (world_matrix.to_3x3() @ get_edge_normal(edge)).normalized()
+
+def create_rotation_matrix_from_edge_coords(world_matrix, co_a, co_b, face_normals):
+    binormal = (world_matrix.to_3x3() @ (co_b - co_a)).normalized()
+
+    if face_normals:
+        normal = (world_matrix.to_3x3() @ v3_sum_normalized(face_normals)).normalized()
         tangent = binormal.cross(normal).normalized()
         normal = tangent.cross(binormal).normalized()
     else:
@@ -108,8 +120,12 @@ def calculate_object_up(world_matrix, normal):
 
 
 def create_rotation_matrix_from_face(world_matrix, face):
-    normal = (world_matrix.to_3x3() @ face.normal).normalized()
-    tangent = (world_matrix.to_3x3() @ face.calc_tangent_edge_pair()).normalized()
+    return create_rotation_matrix_from_face_vectors(world_matrix, face.normal, face.calc_tangent_edge_pair())
+
+
+def create_rotation_matrix_from_face_vectors(world_matrix, face_normal, face_tangent):
+    normal = (world_matrix.to_3x3() @ face_normal).normalized()
+    tangent = (world_matrix.to_3x3() @ face_tangent).normalized()
     binormal = normal.cross(tangent)
 
     return create_transposed_rotation_matrix(tangent, binormal, normal)
@@ -26,14 +26,106 @@
 # ---
 
 import bpy
+import os
 import re
 from math import radians
 from . preferences import get_preferences
 from . polling import app_minor_version
+from . attributes import set_mesh_smooth
+
+
+# Per-object index of ND-tagged modifiers, keyed by the object's pointer. Entries are
+# dropped whenever the depsgraph reports the object as updated (and explicitly by the
+# helpers below that add, remove, or rename modifiers), then rebuilt lazily on lookup.
+modifier_indexes = {}
+
+
+def get_mod_base_name(mod_name):
+    return re.sub(r"(.+?)(\.[0-9]{3})$", r"\1", mod_name)
+
+
+def get_mod_roles(mod):
+    roles = []
+
+    if is_sba_mod(mod):
+        roles.append('SBA')
+
+    if "Weighted Normal — ND WN" in mod.name:
+        roles.append('WN')
+
+    if "Triangulate — ND" in mod.name:
+        roles.append('TRIANGULATE')
+
+    if "Weld — ND SW" in mod.name or "Weld — ND B" in mod.name or "Decimate — ND SD" in mod.name:
+        roles.append('SIMPLIFY')
+
+    if mod.type == 'BEVEL':
+        roles.append('BEVEL')
+
+    return roles
+
+
+def build_modifier_index(object):
+    base_names = {}
+    roles = {}
+
+    for mod in object.modifiers:
+        base_names[mod.name] = get_mod_base_name(mod.name)
+        for role in get_mod_roles(mod):
+            roles.setdefault(role, []).append(mod.name)
+
+    return {'base_names': base_names, 'roles': roles}
+
+
+def get_modifier_index(object):
+    key = object.as_pointer()
+    index = modifier_indexes.get(key)
+
+    # Comparing names is far cheaper than rebuilding (no regex matching), and also catches
+    # renames that the depsgraph handler hasn't been told about yet.
+    if index is None or list(index['base_names']) != object.modifiers.keys():
+        index = build_modifier_index(object)
+        modifier_indexes[key] = index
+
+    return index
+
+
+def invalidate_modifier_index(object):
+    modifier_indexes.pop(object.as_pointer(), None)
+
+
+def get_mods_with_role(object, role):
+    index = get_modifier_index(object)
+    mods = [object.modifiers.get(name) for name in index['roles'].get(role, [])]
+
+    # A modifier was renamed or replaced since the index was built.
+    if None in mods:
+        invalidate_modifier_index(object)
+        index = get_modifier_index(object)
+        mods = [object.modifiers.get(name) for name in index['roles'].get(role, [])]
+
+    return mods
+
+
+def is_heavy_angle_bevel(mod):
+    if mod.type == 'BEVEL' and mod.affect == 'EDGES' and mod.limit_method == 'ANGLE':
+        return mod.segments > 1 or (mod.segments == 1 and mod.harden_normals)
+
+    return False
+
+
+def invalidate_modifier_indexes(object_updates):
+    for key, object, update in object_updates:
+        modifier_indexes.pop(key, None)
+
+
+def clear_modifier_indexes():
+    modifier_indexes.clear()
 
 
 def new_modifier(object, mod_name, mod_type, rectify=True):
     mod = object.modifiers.new(mod_name, mod_type)
+    invalidate_modifier_index(object)
 
     mod.show_viewport = True
     mod.show_in_editmode = True
@@ -52,43 +144,68 @@ def new_modifier(object, mod_name, mod_type, rectify=True):
 def move_mod_to_index(object, mod_name, index):
     if app_minor_version() < (4, 0):
         bpy.ops.object.modifier_move_to_index({'object': object}, modifier=mod_name, index=index)
-    else:
-        with bpy.context.temp_override(object=object):
-            bpy.ops.object.modifier_move_to_index(modifier=mod_name, index=index)
+        return
 
+    from_index = object.modifiers.find(mod_name)
+    if from_index != -1 and from_index != index:
+        object.modifiers.move(from_index, index)
 
-def rectify_mod_order(object, mod_name):
-    mods = list(object.modifiers)
 
-    if len(mods) < 2:
-        return
+def get_stable_mod_names(mod_names, positions):
+    # The longest run of modifiers that are already in the correct relative
+    # order (LIS of their current positions) never needs to be moved.
+    lengths = [1] * len(positions)
+    previous = [-1] * len(positions)
+
+    for i in range(len(positions)):
+        for j in range(i):
+            if positions[j] < positions[i] and lengths[j] + 1 > lengths[i]:
+                lengths[i] = lengths[j] + 1
+                previous[i] = j
+
+    stable = set()
+    i = max(range(len(lengths)), key=lambda x: lengths[x]) if lengths else -1
+    while i != -1:
+        stable.add(mod_names[i])
+        i = previous[i]
+
+    return stable
+
+
+def reorder_modifiers(object, mod_names):
+    mods = object.modifiers
+    mod_names = [name for name in mod_names if mods.get(name) is not None]
+    mod_names += [mod.name for mod in mods if mod.name not in mod_names]
+
+    stable = get_stable_mod_names(mod_names, [mods.find(name) for name in mod_names])
+
+    # Place every other modifier directly after its predecessor in the target order,
+    # which results in the minimum number of moves for the given permutation.
+    for i, mod_name in enumerate(mod_names):
+        if mod_name in stable:
+            continue
 
-    matching_mod_index = None
-    for index, mod in enumerate(mods):
-        if "Weighted Normal — ND WN" in mod.name:
-            matching_mod_index = index
-            break
+        to_index = 0
+        if i > 0:
+            from_index = mods.find(mod_name)
+            previous_index = mods.find(mod_names[i - 1])
+            to_index = previous_index if from_index < previous_index else previous_index + 1
 
-        if "Weld — ND SW" in mod.name:
-            matching_mod_index = index
-            break
+        move_mod_to_index(object, mod_name, to_index)
 
-        if "Weld — ND B" in mod.name:
-            matching_mod_index = index
-            break
 
-        if "Decimate — ND SD" in mod.name:
-            matching_mod_index = index
-            break
+def rectify_mod_order(object, mod_name):
+    if len(object.modifiers) < 2:
+        return
 
-        if mod.type == 'BEVEL' and mod.affect == 'EDGES' and mod.limit_method == 'ANGLE':
-            if mod.segments > 1 or (mod.segments == 1 and mod.harden_normals):
-                matching_mod_index = index
-                break
+    candidates = get_mods_with_role(object, 'WN') + get_mods_with_role(object, 'SIMPLIFY')
+    candidates += [mod for mod in get_mods_with_role(object, 'BEVEL') if is_heavy_angle_bevel(mod)]
 
-    if matching_mod_index is None:
+    if not candidates:
         return
 
+    matching_mod_index = min(object.modifiers.find(mod.name) for mod in candidates)
+
     move_mod_to_index(object, mod_name, matching_mod_index)
 
 
@@ -106,77 +223,128 @@ def is_sba_mod(mod):
 
 
 def get_sba_mod(object):
-    for mod in object.modifiers:
-        if is_sba_mod(mod):
-            return mod
+    mods = get_mods_with_role(object, 'SBA')
 
-    return None
+    return mods[0] if mods else None
 
 
 def has_sba_mod(object):
     return get_sba_mod(object) != None
 
 
-def add_smooth_by_angle(context, object):
-    if app_minor_version() < (4, 1):
-        return
+def get_sba_node_group():
+    sba_node_group = bpy.data.node_groups.get("Smooth by Angle")
 
-    if has_sba_mod(object):
-        return
+    if sba_node_group is not None:
+        return sba_node_group
 
-    with bpy.context.temp_override(object=object):
-        sba_node_group = bpy.data.node_groups.get("Smooth by Angle")
+    # Append the node group straight from Blender's bundled essentials (once per file),
+    # so that every subsequent modifier can be attached to it directly.
+    path = bpy.utils.system_resource('DATAFILES', path=os.path.join("assets", "geometry_nodes", "smooth_by_angle.blend"))
+    if not path or not os.path.isfile(path):
+        return None
+
+    with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+        data_to.node_groups = [name for name in data_from.node_groups if name == "Smooth by Angle"]
+
+    return data_to.node_groups[0] if data_to.node_groups else None
 
-        if sba_node_group == None and app_minor_version() == (4, 1):
+
+def add_sba_mod_with_operator(object):
+    # Fallback for when the essentials file cannot be found. Once either operator has run, the
+    # node group lives in the file and all other objects take the direct path.
+    with bpy.context.temp_override(object=object):
+        if app_minor_version() == (4, 1):
             bpy.ops.object.shade_smooth()
             bpy.ops.object.modifier_add_node_group(asset_library_type='ESSENTIALS', asset_library_identifier="",
                     relative_asset_identifier="geometry_nodes\\smooth_by_angle.blend\\NodeTree\\Smooth by Angle")
-
-        if sba_node_group == None and app_minor_version() > (4, 1):
+        else:
             bpy.ops.object.shade_auto_smooth()
 
-        sba_mod = None
+    invalidate_modifier_index(object)
+
+    return get_sba_mod(object)
+
+
+def add_smooth_by_angle(context, object):
+    add_smooth_by_angle_batch(context, [object])
+
+
+def add_smooth_by_angle_batch(context, objects):
+    if app_minor_version() < (4, 1):
+        return
+
+    objects = [object for object in objects if not has_sba_mod(object)]
+
+    if not objects:
+        return
+
+    sba_node_group = get_sba_node_group()
+    default_angle = radians(float(get_preferences().default_smoothing_angle))
 
-        if sba_node_group != None:
+    for object in objects:
+        if sba_node_group is None:
+            sba_mod = add_sba_mod_with_operator(object)
+            sba_node_group = bpy.data.node_groups.get("Smooth by Angle")
+        else:
             sba_mod = object.modifiers.new("Smooth — ND SBA", 'NODES')
             sba_mod.node_group = sba_node_group
             if app_minor_version() > (4, 1):
                 sba_mod.use_pin_to_last = True
-            if app_minor_version() >= (4, 1):
-                sba_mod.show_group_selector = False
-
-        # It isn't pretty, but it's the only way to get the modifier as modifier_add_node_group/shade_auto_smooth
-        # runs asynchronously which doesn't guarantee the modifier is ready before the next chunk of code.
-        # This is a temporary solution until Blender provides a way to check if the modifier is ready.
-        count = 0
-        while sba_mod is None and count < 25:
-            sba_mod = get_sba_mod(object)
-            if sba_mod != None:
-                break
-            object.data.update()
-            count += 1
-
-        # If the modifier is still None, give up.
-        if sba_mod == None:
-            return
+            sba_mod.show_group_selector = False
+
+        if sba_mod is None:
+            continue
 
         sba_mod.name = "Smooth — ND SBA"
-        set_smoothing_angle(context, object, radians(float(get_preferences().default_smoothing_angle)), True)
+        invalidate_modifier_index(object)
+
+        set_smoothing_angle(context, object, default_angle, True)
 
         ensure_tail_mod_consistency(object, force=True)
 
 
-def set_smoothing_angle(context, object, angle, ignore_sharpness=False):
-    mod = get_sba_mod(object)
+def add_smooth_shading(context, object):
+    # Adds ND's default smooth shading to the object, in either object or edit mode.
+    if app_minor_version() >= (4, 1):
+        # Only the operator fallback (used when the bundled node group is unavailable)
+        # needs object mode, everything else can be set up from within edit mode.
+        if object.mode != 'EDIT' or has_sba_mod(object) or get_sba_node_group() is not None:
+            add_smooth_by_angle(context, object)
+            return
 
-    if mod is None:
+        bpy.ops.object.mode_set(mode='OBJECT')
+        add_smooth_by_angle(context, object)
+        bpy.ops.object.mode_set(mode='EDIT')
         return
 
-    mod["Input_1"] = angle
-    mod["Socket_1"] = ignore_sharpness
+    set_mesh_smooth(object.data)
+    object.data.use_auto_smooth = True
+    object.data.auto_smooth_angle = radians(float(get_preferences().default_smoothing_angle))
+
+
+def set_smoothing_angle(context, object, angle, ignore_sharpness=False):
+    set_smoothing_angle_batch(context, [object], angle, ignore_sharpness)
+
+
+def set_smoothing_angle_batch(context, objects, angle, ignore_sharpness=False):
+    node_groups = set()
+
+    for object in objects:
+        mod = get_sba_mod(object)
+
+        if mod is None:
+            continue
+
+        mod["Input_1"] = angle
+        mod["Socket_1"] = ignore_sharpness
+
+        node_groups.add(mod.node_group)
+        object.update_tag()
 
-    mod.node_group.interface_update(context)
-    object.data.update()
+    # All SBA modifiers share the same node group, so the interface only needs updating once.
+    for node_group in node_groups:
+        node_group.interface_update(context)
 
 
 def ensure_tail_mod_consistency(object, force=False):
@@ -186,64 +354,216 @@ def ensure_tail_mod_consistency(object, force=False):
         return
 
     mod_order = ['Smooth by Angle', 'Smooth — ND SBA', 'Weighted Normal — ND WN', 'Triangulate — ND']
-    object_mods = [mod.name for mod in list(object.modifiers)]
+    head_mods = [mod.name for mod in object.modifiers if mod.name not in mod_order]
+
+    reorder_modifiers(object, head_mods + mod_order)
+
+
+def bake_modifiers(context, targets):
+    # Temporarily disable every modifier that isn't being applied so that a single depsgraph
+    # evaluation produces the final mesh for every target (evaluated in parallel by Blender),
+    # instead of applying (and re-evaluating the stack for) each modifier one at a time.
+    visibility = []
+    for object, mod_names in targets:
+        for mod in object.modifiers:
+            visibility.append((mod, mod.show_viewport))
+            mod.show_viewport = mod.show_viewport and mod.name in mod_names
+
+    depsgraph = context.evaluated_depsgraph_get()
+
+    meshes = []
+    for object, mod_names in targets:
+        object_eval = object.evaluated_get(depsgraph)
+        meshes.append(bpy.data.meshes.new_from_object(object_eval, preserve_all_data_layers=True, depsgraph=depsgraph))
+
+    for mod, show_viewport in visibility:
+        mod.show_viewport = show_viewport
+
+    return meshes
 
-    for mod_name in mod_order:
-        if not(mod_name in object_mods):
+
+# Per-type lists of modifier properties, built from the RNA definition once per session.
+# Properties are kept in alphabetical order, which is the order they were previously
+# discovered (and written) in via inspect.getmembers.
+modifier_schemas = {}
+
+
+def get_modifier_schema(mod):
+    schema = modifier_schemas.get(mod.type)
+    if schema is not None:
+        return schema
+
+    writable = []
+    drivable = []
+    for prop in sorted(mod.bl_rna.properties, key=lambda p: p.identifier):
+        if prop.identifier == 'rna_type' or prop.is_readonly or prop.type == 'COLLECTION':
             continue
 
-        if app_minor_version() < (4, 0):
-            bpy.ops.object.modifier_move_to_index({'object': object}, modifier=mod_name, index=len(object_mods) - 1)
-        else:
-            with bpy.context.temp_override(object=object):
-                bpy.ops.object.modifier_move_to_index(modifier=mod_name, index=len(object_mods) - 1)
+        writable.append(prop.identifier)
 
+        if prop.is_animatable and prop.type in {'BOOLEAN', 'INT', 'FLOAT', 'ENUM'}:
+            drivable.append(prop.identifier)
 
-def remove_problematic_boolean_mods(object):
-    mods = [mod for mod in object.modifiers]
-    remove_mods = []
+    schema = {
+        'writable': tuple(writable),
+        'drivable': tuple(drivable),
+    }
 
-    for mod in mods:
-        if mod.name == "Weighted Normal — ND WN":
-            remove_mods.append(mod)
+    modifier_schemas[mod.type] = schema
+
+    return schema
+
+
+def copy_modifier_properties(source, target, props):
+    for prop in props:
+        try:
+            setattr(target, prop, getattr(source, prop))
+        except:
+            pass
+
+
+# Properties that never describe a modifier's configuration (UI state, runtime status, and
+# identifiers), which are neither synced between objects nor part of a modifier's signature.
+hard_ignore_list = {
+    '__doc__',
+    '__module__',
+    '__slotnames__',
+    '__slots__',
+    'bl_rna',
+    'custom_profile',
+    'execution_time',
+    'is_active',
+    'is_bind',
+    'is_bound',
+    'is_cached',
+    'is_external',
+    'is_override_data',
+    'persistent_uid',
+    'rna_type',
+    'show_expanded',
+    'show_in_editmode',
+    'show_on_cage',
+    'show_render',
+    'show_viewport',
+    'type',
+}
+
+
+def freeze_property_value(value):
+    if isinstance(value, bpy.types.bpy_struct):
+        return value.as_pointer()
+
+    if isinstance(value, set):
+        return tuple(sorted(value))
+
+    if hasattr(value, "to_list"):
+        return tuple(value.to_list())
+
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        return tuple(value)
+
+    return value
+
+
+def get_modifier_signature(mod):
+    signature = [mod.type]
+
+    for prop in mod.bl_rna.properties:
+        # Read-only properties are runtime state (e.g. execution_time, is_bound) which changes
+        # with every evaluation, so they'd prevent identical stacks from ever matching.
+        if prop.is_readonly or prop.identifier in hard_ignore_list or prop.identifier in {'name', 'is_override_data_editable'}:
             continue
 
-        if mod.name == "Triangulate — ND":
-            remove_mods.append(mod)
+        if prop.type == 'COLLECTION':
             continue
 
-        if mod.type == 'BEVEL' and mod.affect == 'EDGES' and mod.limit_method == 'ANGLE':
-            if mod.segments > 1 or (mod.segments == 1 and mod.harden_normals):
-                remove_mods.append(mod)
-                continue
+        signature.append((prop.identifier, freeze_property_value(getattr(mod, prop.identifier))))
+
+    # The custom profile is only evaluated when the bevel is using it, and as its curve
+    # can't be compared cheaply, stacks using one are only ever matched with themselves.
+    if mod.type == 'BEVEL' and mod.profile_type == 'CUSTOM':
+        signature.append(('custom_profile', mod.custom_profile.as_pointer()))
+
+    # Geometry nodes inputs are stored as ID properties on the modifier.
+    if mod.type == 'NODES':
+        for key in mod.keys():
+            signature.append((key, freeze_property_value(mod[key])))
+
+    return tuple(signature)
+
+
+def get_modifier_stack_signature(object, mod_names):
+    mods = [mod for mod in object.modifiers if mod.name in mod_names]
+    signature = [get_modifier_signature(mod) for mod in mods]
+
+    # Vertex groups are referenced by name, so the object's groups must line up.
+    signature.append(tuple(vg.name for vg in object.vertex_groups))
+
+    # Any modifier that references another object (or may do so via geometry nodes)
+    # evaluates relative to the owner's transform, so identical stacks on differently
+    # placed instances can still produce different meshes.
+    is_transform_dependent = any(mod.type == 'NODES' or any(
+        prop.type == 'POINTER' and prop.fixed_type.identifier == 'Object' for prop in mod.bl_rna.properties) for mod in mods)
+
+    if is_transform_dependent:
+        signature.append(tuple(tuple(row) for row in object.matrix_world))
+
+    return tuple(signature)
+
+
+def get_fast_boolean_solver():
+    return 'FLOAT' if app_minor_version() >= (5, 0) else 'FAST'
+
+
+def begin_boolean_preview(mods):
+    # Boolean modifiers are switched to the fast solver while an operator is interactive,
+    # the returned state is used to switch them back to their chosen solver afterwards.
+    fast_solver = get_fast_boolean_solver()
+
+    preview_state = []
+    for mod in mods:
+        if mod.type == 'BOOLEAN' and mod.solver != fast_solver:
+            preview_state.append((mod.id_data, mod.name, mod.solver))
+            mod.solver = fast_solver
+
+    return preview_state
+
+
+def end_boolean_preview(preview_state):
+    for object, mod_name, solver in preview_state:
+        mod = object.modifiers.get(mod_name)
+        if mod:
+            mod.solver = solver
+
+
+def remove_problematic_boolean_mods(object):
+    remove_mods = [mod for mod in get_mods_with_role(object, 'WN') if mod.name == "Weighted Normal — ND WN"]
+    remove_mods += [mod for mod in get_mods_with_role(object, 'TRIANGULATE') if mod.name == "Triangulate — ND"]
+    remove_mods += [mod for mod in get_mods_with_role(object, 'BEVEL') if is_heavy_angle_bevel(mod)]
 
     for mod in remove_mods:
         object.modifiers.remove(mod)
 
+    invalidate_modifier_index(object)
+
+
+def remove_indexed_modifiers(object, mod_names):
+    for mod_name in mod_names:
+        mod = object.modifiers.get(mod_name)
+        if mod is not None:
+            object.modifiers.remove(mod)
+            invalidate_modifier_index(object)
+
 
 def remove_modifiers_ending_with(objects, suffix, strict=False):
     for object in objects:
-        mods = object.modifiers
-        mod_names = [mod.name for mod in mods]
-        for mod_name in mod_names:
-            base_name = re.sub(r"(.+?)(\.[0-9]{3})$", r"\1", mod_name) if not strict else mod_name
-            if base_name.endswith(suffix):
-                if app_minor_version() < (4, 0):
-                    bpy.ops.object.modifier_remove({'object': object}, modifier=mod_name)
-                else:
-                    with bpy.context.temp_override(object=object):
-                        bpy.ops.object.modifier_remove(modifier=mod_name)
+        base_names = get_modifier_index(object)['base_names']
+        remove_modifiers = [mod_name for mod_name, base_name in base_names.items() if (mod_name if strict else base_name).endswith(suffix)]
+        remove_indexed_modifiers(object, remove_modifiers)
 
 
 def remove_modifiers_starting_with(objects, suffix):
     for object in objects:
-        mods = object.modifiers
-        mod_names = [mod.name for mod in mods]
-        for mod_name in mod_names:
-            base_name = re.sub(r"(.+?)(\.[0-9]{3})$", r"\1", mod_name)
-            if base_name.startswith(suffix):
-                if app_minor_version() < (4, 0):
-                    bpy.ops.object.modifier_remove({'object': object}, modifier=mod_name)
-                else:
-                    with bpy.context.temp_override(object=object):
-                        bpy.ops.object.modifier_remove(modifier=mod_name)
+        base_names = get_modifier_index(object)['base_names']
+        remove_modifiers = [mod_name for mod_name, base_name in base_names.items() if base_name.startswith(suffix)]
+        remove_indexed_modifiers(object, remove_modifiers)
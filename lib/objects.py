@@ -31,6 +31,7 @@ from math import radians
 from mathutils.geometry import distance_point_to_plane, normal
 from . preferences import get_preferences
 from . polling import app_minor_version
+from . attributes import clear_bevel_weights, remove_nd_edge_attributes
 
 
 def add_single_vertex_object(cls, context, name):
@@ -80,6 +81,20 @@ def update_child_matrices(obj, mx):
         c.matrix_parent_inverse = new_matrix @ parent_matrix
 
 
+def replace_mesh(objects, mesh):
+    old_meshes = {obj.data for obj in objects}
+    name = objects[0].data.name
+
+    for obj in objects:
+        obj.data = mesh
+
+    for old_mesh in old_meshes:
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
+    mesh.name = name
+
+
 def create_duplicate_liftable_geometry(context, mode, object_name, ignore_complex_geo=True):
     bpy.ops.object.duplicate()
 
@@ -101,29 +116,15 @@ def create_duplicate_liftable_geometry(context, mode, object_name, ignore_comple
     depsgraph = context.evaluated_depsgraph_get()
     object_eval = context.active_object.evaluated_get(depsgraph)
 
-    context.active_object.modifiers.clear()
-
-    vertex_groups = context.active_object.vertex_groups.values()
-    for vg in vertex_groups:
-        context.active_object.vertex_groups.remove(vg)
-
-    bm = bmesh.new()
-    bm.from_mesh(object_eval.data)
-
-    bevel_weight_layer = None
+    mesh = bpy.data.meshes.new_from_object(object_eval, preserve_all_data_layers=True, depsgraph=depsgraph)
 
-    if app_minor_version() < (4, 0):
-        bevel_weight_layer = bm.edges.layers.bevel_weight.verify()
-    else:
-        bevel_weight_layer = bm.edges.layers.float.get("bevel_weight_edge", None)
+    context.active_object.modifiers.clear()
+    replace_mesh([context.active_object], mesh)
 
-    if bevel_weight_layer is not None:
-        selected_edges = list(bm.edges)
-        for edge in selected_edges:
-            edge[bevel_weight_layer] = 0
+    context.active_object.vertex_groups.clear()
 
-    bm.to_mesh(context.active_object.data)
-    bm.free()
+    clear_bevel_weights(mesh)
+    remove_nd_edge_attributes(mesh)
 
     bpy.ops.object.mode_set_with_submode(mode='EDIT', mesh_select_mode=mode)
     bpy.ops.mesh.select_all(action='DESELECT')
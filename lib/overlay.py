@@ -27,7 +27,7 @@
 
 import bpy
 import blf
-from . preferences import get_preferences
+from . preferences import get_preferences, get_modal_preferences, capture_preferences
 from . polling import app_minor_version
 
 
@@ -52,7 +52,15 @@ def unregister_draw_handler():
         redraw_regions()
 
 
-def redraw_regions():
+def redraw_regions(region=None):
+    if region is not None:
+        try:
+            region.tag_redraw()
+            return
+        except ReferenceError:
+            # The region was closed mid-operation, fall back to redrawing every 3D viewport.
+            pass
+
     for area in bpy.context.window.screen.areas:
         if area.type == 'VIEW_3D':
             for region in area.regions:
@@ -75,6 +83,10 @@ def toggle_pin_overlay(cls, event):
 def toggle_operator_passthrough(cls):
     cls.operator_passthrough = not cls.operator_passthrough
 
+    # Preferences may have been changed while the operator was paused.
+    if not cls.operator_passthrough and hasattr(cls, 'prefs'):
+        capture_preferences(cls)
+
 
 def init_overlay(cls, event):
     cls.overlay_offset_x = 25
@@ -95,21 +107,47 @@ def init_overlay(cls, event):
     cls.operator_passthrough = False
     cls.mouse_warped = False
 
+    cls.overlay_region = bpy.context.region
+    cls.overlay_state = None
+
     if get_preferences().lock_overlay_pinning:
         cls.pin_overlay = get_preferences().overlay_pinned
         cls.overlay_x = get_preferences().overlay_pin_x
         cls.overlay_y = get_preferences().overlay_pin_y
 
 
-def update_overlay(cls, context, event):
+def get_overlay_state(cls):
+    # Points are replaced (rather than mutated) whenever an operator recalculates them,
+    # so they're compared by identity (holding a reference so the id can't be reused).
+    points = tuple(getattr(cls, name, None) for name in ('primary_points', 'secondary_points', 'tertiary_points', 'guide_line'))
+
+    return (cls.overlay_x, cls.overlay_y, cls.pin_overlay, cls.operator_passthrough), points
+
+
+def has_overlay_state_changed(cls, state):
+    if cls.overlay_state is None:
+        return True
+
+    values, points = state
+    prev_values, prev_points = cls.overlay_state
+
+    return values != prev_values or any(a is not b for a, b in zip(points, prev_points))
+
+
+def update_overlay(cls, context, event, force_redraw=False):
     if not cls.pin_overlay:
         cls.overlay_x = event.mouse_x - cls.region_offset_x + cls.overlay_offset_x
         cls.overlay_y = event.mouse_y - cls.region_offset_y + cls.overlay_offset_y
 
-    if not cls.operator_passthrough and get_preferences().enable_mouse_values:
+    if not cls.operator_passthrough and get_modal_preferences(cls).enable_mouse_values:
         wrap_cursor(cls, context, event)
 
-    redraw_regions()
+    # Only the region that owns the operator is redrawn, and only when something it displays
+    # may have changed (key presses/releases can change highlighted options and hints).
+    state = get_overlay_state(cls)
+    if force_redraw or event.value in {'PRESS', 'RELEASE'} or has_overlay_state_changed(cls, state):
+        cls.overlay_state = state
+        redraw_regions(cls.overlay_region)
 
 
 def wrap_cursor(cls, context, event):
@@ -82,39 +82,70 @@ def redraw_regions():
                     region.tag_redraw()
 
 
+# Shaders are compiled once per session and shared by every operator that displays points.
+shader_cache = {}
+
+
+def get_line_shader():
+    if 'line' not in shader_cache:
+        if app_minor_version() < (4, 0):
+            shader_cache['line'] = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+        elif app_minor_version() >= (4, 5) and is_vulkan():
+            shader_cache['line'] = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        elif not is_vulkan():
+            shader_cache['line'] = gpu.shader.from_builtin('UNIFORM_COLOR')
+        else:
+            shader_cache['line'] = None
+
+    return shader_cache['line']
+
+
+def get_circle_shader():
+    if 'circle' not in shader_cache:
+        if app_minor_version() >= (4, 5) and is_vulkan():
+            shader_cache['circle'] = gpu.shader.from_builtin('POINT_UNIFORM_COLOR')
+        else:
+            circle_shader_info = gpu.types.GPUShaderCreateInfo()
+            circle_shader_info.vertex_source(dot_vertex_shader)
+            circle_shader_info.fragment_source(dot_fragment_shader)
+            circle_shader_info.vertex_in(0, 'VEC3', 'pos')
+            circle_shader_info.push_constant('MAT4', 'viewProjectionMatrix')
+            circle_shader_info.push_constant('VEC4', 'color')
+            circle_shader_info.fragment_out(0, 'VEC4', 'fragColor')
+
+            shader_cache['circle'] = gpu.shader.create_from_info(circle_shader_info)
+
+    return shader_cache['circle']
+
+
 def init_points(cls):
     cls.primary_points = []
     cls.secondary_points = []
     cls.tertiary_points = []
     cls.guide_line = ()
 
-    cls.line_shader = None
-    cls.circle_shader = None
+    cls.line_shader = get_line_shader()
+    cls.circle_shader = get_circle_shader()
 
-    if app_minor_version() < (4, 0):
-        cls.line_shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+    cls.points_batches = {}
 
-    if app_minor_version() >= (4, 0) and not is_vulkan():
-        cls.line_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
 
-    if app_minor_version() >= (4, 5) and is_vulkan():
-        cls.line_shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+def get_points_batch(cls, key, shader, type, points):
+    # Batches are cached against the point sequence they were built from, so operators must
+    # assign a new sequence (never mutate one in place, or hold live values such as an
+    # object's location) whenever the points change. A batch is then only rebuilt when its
+    # sequence is swapped out (or grows/shrinks), without re-reading the points every redraw.
+    cached = cls.points_batches.get(key)
+    if cached is not None and cached[0] is points and cached[1] == len(points):
+        return cached[2]
 
-    if app_minor_version() >= (4, 5) and is_vulkan():
-        cls.circle_shader = gpu.shader.from_builtin('POINT_UNIFORM_COLOR')
-    else:
-        circle_shader_info = gpu.types.GPUShaderCreateInfo()
-        circle_shader_info.vertex_source(dot_vertex_shader)
-        circle_shader_info.fragment_source(dot_fragment_shader)
-        circle_shader_info.vertex_in(0, 'VEC3', 'pos')
-        circle_shader_info.push_constant('MAT4', 'viewProjectionMatrix')
-        circle_shader_info.push_constant('VEC4', 'color')
-        circle_shader_info.fragment_out(0, 'VEC4', 'fragColor')
+    batch = batch_for_shader(shader, type, {"pos": points})
+    cls.points_batches[key] = (points, len(points), batch)
 
-        cls.circle_shader = gpu.shader.create_from_info(circle_shader_info)
+    return batch
 
 
-def draw_circles(shader, points, radius, color):
+def draw_circles(shader, batch, radius, color):
     gpu.state.program_point_size_set(False)
 
     if app_minor_version() >= (4, 5) and is_vulkan():
@@ -132,13 +163,11 @@ def draw_circles(shader, points, radius, color):
 
     shader.uniform_float("color", color)
 
-    batch = batch_for_shader(shader, 'POINTS', {"pos": points})
-
     shader.bind()
     batch.draw(shader)
 
 
-def draw_guideline(shader, line, size, color):
+def draw_guideline(shader, batch, size, color):
     gpu.state.depth_test_set('NONE')
     gpu.state.blend_set('ALPHA')
     gpu.state.line_width_set(size)
@@ -149,17 +178,23 @@ def draw_guideline(shader, line, size, color):
         shader.uniform_float("viewportSize", gpu.state.viewport_get()[2:])
         shader.uniform_float("lineWidth", size)
 
-    batch = batch_for_shader(shader, 'LINES', {"pos": line})
-
     shader.bind()
     batch.draw(shader)
 
 
 def update_points(cls):
-    draw_guideline(cls.line_shader, cls.guide_line, 3, get_preferences().points_guide_line_color)
+    prefs = get_preferences()
+
+    if len(cls.guide_line) > 0:
+        batch = get_points_batch(cls, 'guide_line', cls.line_shader, 'LINES', cls.guide_line)
+        draw_guideline(cls.line_shader, batch, 3, prefs.points_guide_line_color)
 
-    draw_circles(cls.circle_shader, cls.primary_points, 20, get_preferences().points_primary_color)
-    draw_circles(cls.circle_shader, cls.secondary_points, 15, get_preferences().points_secondary_color)
-    draw_circles(cls.circle_shader, cls.tertiary_points, 25, get_preferences().points_tertiary_color)
+    for key, radius, color in [('primary_points', 20, prefs.points_primary_color),
+                               ('secondary_points', 15, prefs.points_secondary_color),
+                               ('tertiary_points', 25, prefs.points_tertiary_color)]:
+        points = getattr(cls, key)
+        if len(points) == 0:
+            continue
 
-    redraw_regions()
+        batch = get_points_batch(cls, key, cls.circle_shader, 'POINTS', points)
+        draw_circles(cls.circle_shader, batch, radius, color)
@@ -26,13 +26,64 @@
 # ---
 
 import bpy
+from types import SimpleNamespace
 from . addons import get_registered_addon_name
 
 
+UNIT_FACTORS = {
+    'KILOMETERS' : 1000,
+    'METERS'     : 1,
+    'CENTIMETERS': 0.01,
+    'MILLIMETERS': 0.001,
+    'MICROMETERS': 1e-6,
+    'MILES'      : 1609.34,
+    'FEET'       : 0.3048,
+    'INCHES'     : 0.0254,
+    'THOU'       : 0.0254 / 1000,
+}
+
+UNIT_SUFFIXES = {
+    'KILOMETERS' : 'km',
+    'METERS'     : 'm',
+    'CENTIMETERS': 'cm',
+    'MILLIMETERS': 'mm',
+    'MICROMETERS': 'μm',
+    'MILES'      : 'mi',
+    'FEET'       : "'",
+    'INCHES'     : '"',
+    'THOU'       : 'thou',
+}
+
+# Preferences read on every modal event, captured once per operator invocation.
+MODAL_PREFERENCES = [
+    'overlay_reset_key',
+    'overlay_pin_key',
+    'overlay_pause_key',
+    'overlay_reset_key_behaviour',
+    'enable_right_click_select',
+    'enable_mouse_values',
+    'extend_mouse_values',
+    'mouse_value_scalar',
+    'mouse_value_steps',
+    'unit_increment_size',
+    'lock_overlay_pinning',
+    'lock_overlay_parameters_on_recall',
+]
+
+
 def get_preferences():
     return bpy.context.preferences.addons[get_registered_addon_name()].preferences
 
 
+def capture_preferences(cls):
+    prefs = get_preferences()
+    cls.prefs = SimpleNamespace(**{name: getattr(prefs, name) for name in MODAL_PREFERENCES})
+
+
+def get_modal_preferences(cls):
+    return getattr(cls, 'prefs', None) or get_preferences()
+
+
 def is_vulkan():
     try:
         return bpy.context.preferences.system.gpu_backend == 'VULKAN'
@@ -51,47 +102,23 @@ def get_scene_unit_factor():
     if bpy.context.scene.unit_settings.system == 'NONE':
         return 1.0
 
-    units = {
-        'KILOMETERS' : 1000,
-        'METERS'     : 1,
-        'CENTIMETERS': 0.01,
-        'MILLIMETERS': 0.001,
-        'MICROMETERS': 1e-6,
-        'MILES'      : 1609.34,
-        'FEET'       : 0.3048,
-        'INCHES'     : 0.0254,
-        'THOU'       : 0.0254 / 1000,
-    }
-
     if bpy.context.scene.unit_settings.length_unit == 'ADAPTIVE':
         if bpy.context.scene.unit_settings.system == 'METRIC':
-            return units['METERS']
+            return UNIT_FACTORS['METERS']
         if bpy.context.scene.unit_settings.system == 'IMPERIAL':
-            return units['FEET']
+            return UNIT_FACTORS['FEET']
 
-    return units[bpy.context.scene.unit_settings.length_unit]
+    return UNIT_FACTORS[bpy.context.scene.unit_settings.length_unit]
 
 
 def get_scene_unit_suffix():
     if bpy.context.scene.unit_settings.system == 'NONE':
         return ""
 
-    units = {
-        'KILOMETERS' : 'km',
-        'METERS'     : 'm',
-        'CENTIMETERS': 'cm',
-        'MILLIMETERS': 'mm',
-        'MICROMETERS': 'μm',
-        'MILES'      : 'mi',
-        'FEET'       : "'",
-        'INCHES'     : '"',
-        'THOU'       : 'thou',
-    }
-
     if bpy.context.scene.unit_settings.length_unit == 'ADAPTIVE':
         if bpy.context.scene.unit_settings.system == 'METRIC':
-            return units['METERS']
+            return UNIT_SUFFIXES['METERS']
         if bpy.context.scene.unit_settings.system == 'IMPERIAL':
-            return units['FEET']
+            return UNIT_SUFFIXES['FEET']
 
-    return units[bpy.context.scene.unit_settings.length_unit]
+    return UNIT_SUFFIXES[bpy.context.scene.unit_settings.length_unit]
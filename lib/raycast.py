@@ -0,0 +1,87 @@
+# ███╗   ██╗██████╗
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝
+#
+# ND (Non-Destructive) Blender Add-on
+# Copyright (C) 2024 Tristan S. & Ian J. (HugeMenace)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+from mathutils.bvhtree import BVHTree
+from bpy_extras.view3d_utils import region_2d_to_vector_3d, region_2d_to_origin_3d
+from . topology import get_mesh_counts
+
+
+# Surface BVH trees keyed by the (original) object's pointer. Trees are built in object space
+# so they remain valid when the object is moved. Entries are dropped (via lib.handlers) whenever
+# the depsgraph reports a geometry update for the object, are checked against the evaluated
+# mesh's element counts, and the whole cache is cleared on load, undo, redo, and unregister.
+surface_bvh_cache = {}
+
+
+def get_surface_bvh(object, depsgraph):
+    mesh = object.evaluated_get(depsgraph).data
+    counts = get_mesh_counts(mesh)
+
+    cached = surface_bvh_cache.get(object.as_pointer())
+    if cached is not None and cached[0] == counts:
+        return cached[1]
+
+    bvh = BVHTree.FromObject(object, depsgraph)
+    surface_bvh_cache[object.as_pointer()] = (counts, bvh)
+
+    return bvh
+
+
+def invalidate_surface_bvh_cache(object_updates):
+    for key, object, update in object_updates:
+        if update.is_updated_geometry:
+            surface_bvh_cache.pop(key, None)
+
+
+def clear_surface_bvh_cache():
+    surface_bvh_cache.clear()
+
+
+def ray_cast_object(object, bvh, ray_origin, ray_direction):
+    world_matrix = object.matrix_world
+    world_matrix_inv = world_matrix.inverted_safe()
+
+    local_origin = world_matrix_inv @ ray_origin
+    local_direction = world_matrix_inv.to_3x3() @ ray_direction
+
+    location, normal, face_index, _ = bvh.ray_cast(local_origin, local_direction)
+    if location is None:
+        return False, None, None, None
+
+    world_normal = (world_matrix_inv.transposed().to_3x3() @ normal).normalized()
+
+    return True, world_matrix @ location, world_normal, face_index
+
+
+def ray_cast_object_from_mouse(context, object, bvh, mouse_coords):
+    region = context.region
+    region_data = context.space_data.region_3d
+
+    view_vector = region_2d_to_vector_3d(region, region_data, mouse_coords)
+    ray_origin = region_2d_to_origin_3d(region, region_data, mouse_coords)
+
+    return ray_cast_object(object, bvh, ray_origin, view_vector)
@@ -0,0 +1,138 @@
+# ███╗   ██╗██████╗
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝
+#
+# ND (Non-Destructive) Blender Add-on
+# Copyright (C) 2024 Tristan S. & Ian J. (HugeMenace)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+
+
+# Object pointer properties through which a modifier or constraint can reference another object.
+REFERENCE_PROPERTIES = (
+    'object',           # Boolean, Lattice, Curve, etc.
+    'target',           # Shrinkwrap, Surface Deform, constraints, etc.
+    'mirror_object',    # Mirror modifier
+    'offset_object',    # Array modifier
+    'start_cap',        # Array modifier
+    'end_cap',          # Array modifier
+    'auxiliary_target', # Shrinkwrap
+)
+
+
+# Reverse index from referenced (util) objects to the objects whose modifiers or constraints
+# reference them, keyed by object pointers. It's built lazily on first use, then kept up to date
+# by re-indexing any object the depsgraph reports as updated. Results are always verified against
+# the owner's current modifiers and constraints, so stale entries are simply dropped.
+reference_index = {
+    'built': False,
+    'referenced_by': {},
+    'references': {},
+}
+
+
+def get_object_references(item):
+    references = []
+    for prop in REFERENCE_PROPERTIES:
+        value = getattr(item, prop, None)
+        if isinstance(value, bpy.types.Object):
+            references.append(value)
+
+    return references
+
+
+def index_object(owner):
+    owner_key = owner.as_pointer()
+    referenced_by = reference_index['referenced_by']
+
+    for util_key in reference_index['references'].pop(owner_key, ()):
+        owners = referenced_by.get(util_key)
+        if owners is not None:
+            owners.pop(owner_key, None)
+
+    util_keys = set()
+    for item in [*getattr(owner, 'modifiers', ()), *owner.constraints]:
+        for util in get_object_references(item):
+            util_keys.add(util.as_pointer())
+
+    for util_key in util_keys:
+        referenced_by.setdefault(util_key, {})[owner_key] = owner
+
+    if util_keys:
+        reference_index['references'][owner_key] = util_keys
+
+
+def build_reference_index():
+    reference_index['referenced_by'].clear()
+    reference_index['references'].clear()
+
+    for obj in bpy.data.objects:
+        index_object(obj)
+
+    reference_index['built'] = True
+
+
+def clear_reference_index():
+    reference_index['built'] = False
+    reference_index['referenced_by'].clear()
+    reference_index['references'].clear()
+
+
+def get_referencing_objects(util):
+    if not reference_index['built']:
+        build_reference_index()
+
+    owners = reference_index['referenced_by'].get(util.as_pointer(), {})
+
+    valid_owners = []
+    for owner_key, owner in list(owners.items()):
+        try:
+            owner.name
+        except ReferenceError:
+            owners.pop(owner_key)
+            continue
+
+        valid_owners.append(owner)
+
+    return valid_owners
+
+
+# Returns (owner, modifier) pairs for every modifier that references the given object,
+# or (owner, constraint) pairs when constraints is True.
+def get_util_references(util, constraints=False):
+    references = []
+    for owner in get_referencing_objects(util):
+        items = owner.constraints if constraints else getattr(owner, 'modifiers', ())
+        for item in items:
+            if any(ref == util for ref in get_object_references(item)):
+                references.append((owner, item))
+
+    return references
+
+
+def update_reference_index(object_updates):
+    if not reference_index['built']:
+        return
+
+    for key, object, update in object_updates:
+        index_object(object)
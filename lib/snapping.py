@@ -0,0 +1,178 @@
+# ███╗   ██╗██████╗
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝
+#
+# ND (Non-Destructive) Blender Add-on
+# Copyright (C) 2024 Tristan S. & Ian J. (HugeMenace)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bmesh
+from mathutils import Vector
+from mathutils.kdtree import KDTree
+from . lazy import numpy
+from . math import create_rotation_matrix_from_vertex_coords, create_rotation_matrix_from_edge_coords, create_rotation_matrix_from_face_vectors
+
+
+# Snap indexes keyed by the (original) object's pointer. Each entry is reused for as long as
+# the evaluated mesh and world matrix it was built from are unchanged, and the whole cache is
+# cleared (via lib.handlers) on load, undo, redo, and unregister.
+snap_index_cache = {}
+
+
+def clear_snap_index_cache():
+    snap_index_cache.clear()
+
+
+def read_array(collection, attr, width=1, dtype=None):
+    # The dtype default is resolved here, as a numpy default argument would import numpy
+    # as soon as this module is loaded (see lib.lazy).
+    values = numpy.empty(len(collection) * width, dtype=numpy.float32 if dtype is None else dtype)
+    collection.foreach_get(attr, values)
+
+    return values.reshape(-1, width) if width > 1 else values
+
+
+def to_world(world_matrix, coords):
+    matrix = numpy.array(world_matrix, dtype=numpy.float32)
+
+    return coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def get_snap_index(object, depsgraph):
+    object_eval = object.evaluated_get(depsgraph)
+    mesh = object_eval.data
+    world_matrix = object.matrix_world.copy()
+
+    coords = read_array(mesh.vertices, "co", 3)
+    edge_verts = read_array(mesh.edges, "vertices", 2, numpy.int32)
+
+    signature = (len(mesh.polygons), hash(coords.tobytes()), hash(edge_verts.tobytes()), tuple(tuple(row) for row in world_matrix))
+
+    cached = snap_index_cache.get(object.as_pointer())
+    if cached is not None and cached['signature'] == signature:
+        return cached
+
+    index = build_snap_index(mesh, world_matrix, coords, edge_verts)
+    index['signature'] = signature
+    snap_index_cache[object.as_pointer()] = index
+
+    return index
+
+
+def build_snap_index(mesh, world_matrix, coords, edge_verts):
+    loop_starts = read_array(mesh.polygons, "loop_start", dtype=numpy.int32)
+    loop_totals = read_array(mesh.polygons, "loop_total", dtype=numpy.int32)
+
+    polygon_order = numpy.argsort(loop_starts, kind='stable')
+
+    vert_points = to_world(world_matrix, coords)
+    edge_points = (vert_points[edge_verts[:, 0]] + vert_points[edge_verts[:, 1]]) / 2.0
+    face_points = to_world(world_matrix, read_array(mesh.polygons, "center", 3))
+
+    edge_lengths = numpy.linalg.norm(vert_points[edge_verts[:, 0]] - vert_points[edge_verts[:, 1]], axis=1)
+
+    points = numpy.concatenate((vert_points, edge_points, face_points))
+
+    tree = KDTree(len(points))
+    for i, co in enumerate(points.tolist()):
+        tree.insert(co, i)
+    tree.balance()
+
+    return {
+        'tree': tree,
+        'world_matrix': world_matrix,
+        'vert_count': len(vert_points),
+        'edge_count': len(edge_points),
+        'snap_distance_factor': float(edge_lengths.mean()) / 2.0 if len(edge_lengths) else 0.0,
+        'coords': coords,
+        'edge_verts': edge_verts,
+        'vert_normals': read_array(mesh.vertices, "normal", 3),
+        'face_normals': read_array(mesh.polygons, "normal", 3),
+        'loop_starts': loop_starts,
+        'loop_totals': loop_totals,
+        'loop_verts': read_array(mesh.loops, "vertex_index", dtype=numpy.int32),
+        'loop_edges': read_array(mesh.loops, "edge_index", dtype=numpy.int32),
+        'loop_polygons': numpy.repeat(polygon_order, loop_totals[polygon_order]),
+        'rotation_matrices': {},
+    }
+
+
+def get_snap_rotation_matrix(index, point_index):
+    # Rotation matrices are only computed for the point that's actually snapped to,
+    # rather than for every vertex, edge, and face up front.
+    world_matrix = index['world_matrix']
+    coords = index['coords']
+    edge_verts = index['edge_verts']
+
+    if point_index < index['vert_count']:
+        vert = point_index
+        linked_edges = numpy.flatnonzero((edge_verts == vert).any(axis=1))
+        linked_verts = edge_verts[linked_edges].ravel()
+        linked_coords = [Vector(coords[v]) for v in linked_verts if v != vert]
+
+        return create_rotation_matrix_from_vertex_coords(world_matrix, Vector(coords[vert]), Vector(index['vert_normals'][vert]), linked_coords)
+
+    point_index -= index['vert_count']
+
+    if point_index < index['edge_count']:
+        vert_a, vert_b = edge_verts[point_index]
+        linked_faces = index['loop_polygons'][index['loop_edges'] == point_index]
+        face_normals = [Vector(index['face_normals'][face]) for face in linked_faces]
+
+        return create_rotation_matrix_from_edge_coords(world_matrix, Vector(coords[vert_a]), Vector(coords[vert_b]), face_normals)
+
+    face = point_index - index['edge_count']
+    loop_start = index['loop_starts'][face]
+    face_verts = index['loop_verts'][loop_start:loop_start + index['loop_totals'][face]]
+
+    # Rebuild just this face so that Blender's own tangent calculation can be used.
+    bm = bmesh.new()
+    bm_face = bm.faces.new([bm.verts.new(coords[v]) for v in face_verts])
+    bm_face.normal_update()
+    face_tangent = bm_face.calc_tangent_edge_pair()
+    bm.free()
+
+    return create_rotation_matrix_from_face_vectors(world_matrix, Vector(index['face_normals'][face]), face_tangent)
+
+
+def find_snap_points(index, location, snap_radius, display_radius):
+    snap_point = None
+    display_points = []
+
+    for co, point_index, distance in index['tree'].find_range(location, display_radius):
+        if distance <= snap_radius:
+            if snap_point is None or distance < snap_point[2]:
+                snap_point = (co, point_index, distance)
+        else:
+            display_points.append(co)
+
+    if snap_point is None:
+        return None, display_points
+
+    co, point_index, _ = snap_point
+
+    rotation_matrix = index['rotation_matrices'].get(point_index)
+    if rotation_matrix is None:
+        rotation_matrix = get_snap_rotation_matrix(index, point_index)
+        index['rotation_matrices'][point_index] = rotation_matrix
+
+    return (co, rotation_matrix), display_points
@@ -0,0 +1,295 @@
+# ███╗   ██╗██████╗
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝
+#
+# ND (Non-Destructive) Blender Add-on
+# Copyright (C) 2024 Tristan S. & Ian J. (HugeMenace)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bpy
+from . modifiers import hard_ignore_list, get_modifier_schema, get_modifier_signature, copy_modifier_properties
+
+
+object_ignore_list = {
+    'object',
+    'offset_object',
+}
+
+property_ignore_list = {
+    'armature',
+    'auxiliary_target',
+    'bone_from',
+    'bone_to',
+    'cache_file',
+    'collection',
+    'curve',
+    'debug_options',
+    'delimit',
+    'driver',
+    'end_cap',
+    'face_count',
+    'falloff_curve',
+    'filepath',
+    'grid_name',
+    'has_velocity',
+    'map_curve',
+    'mask_tex_map_bone',
+    'mask_tex_map_object',
+    'mask_tex_uv_layer',
+    'mask_texture',
+    'mask_vertex_group',
+    'matrix_inverse',
+    'mirror_object',
+    'name',
+    'object_from',
+    'object_path',
+    'object_to',
+    'origin',
+    'projectors',
+    'read_velocity',
+    'rim_vertex_group',
+    'shell_vertex_group',
+    'start_cap',
+    'start_position_object',
+    'subtarget',
+    'target',
+    'texture_coords_bone',
+    'texture_coords_object',
+    'texture',
+    'total_levels',
+    'use_bone_envelopes',
+    'use_vertex_groups',
+    'uv_layer',
+    'vertex_group_a',
+    'vertex_group_b',
+    'vertex_group',
+    'vertex_indices_set',
+    'vertex_indices',
+    'vertex_velocities',
+}
+
+
+# The properties to copy and drive only depend on the modifier type (and whether util
+# references are being overridden), so they're filtered once per session.
+sync_props_cache = {}
+
+
+def get_sync_props(mod, override_utils):
+    key = (mod.type, override_utils)
+
+    sync_props = sync_props_cache.get(key)
+    if sync_props is not None:
+        return sync_props
+
+    schema = get_modifier_schema(mod)
+
+    ignored_props = hard_ignore_list if override_utils else hard_ignore_list | object_ignore_list
+    copy_props = [prop for prop in schema['writable'] if prop not in ignored_props]
+    driver_props = [prop for prop in schema['drivable'] if prop not in hard_ignore_list and prop not in property_ignore_list]
+
+    sync_props = (copy_props, driver_props)
+    sync_props_cache[key] = sync_props
+
+    return sync_props
+
+
+def build_gn_key_table(mod):
+    # Build a dictionary of all the properties and their optional attributes to more
+    # effectively sync them as drivers cannot be added to properties with use_attribute set.
+    keys = list(mod.keys())
+    key_table = dict()
+    for key in keys:
+        if not key.endswith("_use_attribute") and not key.endswith("_attribute_name"):
+            key_table[key] = {}
+            key_table[key]["value"] = mod[key]
+        if key.endswith("_use_attribute"):
+            key_table[key[:-14]]["_use_attribute"] = mod[key]
+        if key.endswith("_attribute_name"):
+            key_table[key[:-15]]["_attribute_name"] = mod[key]
+
+    return key_table
+
+
+def sync_node_group_values(master_mod, mod, key_table):
+    mod.node_group = master_mod.node_group
+    mod.show_group_selector = master_mod.show_group_selector
+
+    for key in key_table:
+        mod[key] = key_table[key]["value"]
+
+        if "_use_attribute" in key_table[key]:
+            mod[key + "_use_attribute"] = bool(key_table[key]["_use_attribute"])
+
+        if "_attribute_name" in key_table[key]:
+            mod[key + "_attribute_name"] = key_table[key]["_attribute_name"]
+
+
+def remove_modifier_drivers(mod):
+    for prop in get_modifier_schema(mod)['drivable']:
+        try:
+            mod.driver_remove(prop)
+        except:
+            pass
+
+    if mod.type == 'NODES':
+        for key in build_gn_key_table(mod):
+            try:
+                mod.driver_remove(f'["{key}"]')
+            except:
+                pass
+
+
+def sync_modifier_values(master_object, copy_object, override_utils):
+    for master_mod in master_object.modifiers:
+        mod = copy_object.modifiers.get(master_mod.name)
+        if mod is None or mod.type != master_mod.type:
+            continue
+
+        if master_mod.type == 'NODES':
+            sync_node_group_values(master_mod, mod, build_gn_key_table(master_mod))
+        else:
+            copy_modifier_properties(master_mod, mod, get_sync_props(master_mod, override_utils)[0])
+
+
+# Template links are an alternative to drivers. Each copy stores a reference to its master
+# (and whether util references are overridden) in custom properties, and the master's modifier
+# values are pushed to its copies in bulk whenever the master's modifiers actually change.
+TEMPLATE_MASTER_KEY = "nd_template_master"
+TEMPLATE_OVERRIDE_UTILS_KEY = "nd_template_override_utils"
+
+
+# Master object pointer -> [master, {copy pointer: copy}, modifier names, last pushed modifier signature].
+template_links = {
+    'built': False,
+    'masters': {},
+}
+
+
+def get_template_names(master_object):
+    return tuple(mod.name for mod in master_object.modifiers)
+
+
+def get_template_signature(master_object):
+    return tuple((mod.name, get_modifier_signature(mod)) for mod in master_object.modifiers)
+
+
+def add_template_link_entry(master_object, copy_object):
+    masters = template_links['masters']
+    entry = masters.get(master_object.as_pointer())
+    if entry is None:
+        entry = [master_object, {}, get_template_names(master_object), get_template_signature(master_object)]
+        masters[master_object.as_pointer()] = entry
+
+    entry[1][copy_object.as_pointer()] = copy_object
+
+
+def build_template_links():
+    template_links['masters'].clear()
+
+    for obj in bpy.data.objects:
+        master_object = obj.get(TEMPLATE_MASTER_KEY)
+        if isinstance(master_object, bpy.types.Object):
+            add_template_link_entry(master_object, obj)
+
+    template_links['built'] = True
+
+
+def clear_template_links():
+    template_links['built'] = False
+    template_links['masters'].clear()
+
+
+def link_template(master_object, copy_object, override_utils):
+    if not template_links['built']:
+        build_template_links()
+
+    unlink_template(copy_object)
+
+    for mod in copy_object.modifiers:
+        remove_modifier_drivers(mod)
+
+    copy_object[TEMPLATE_MASTER_KEY] = master_object
+    copy_object[TEMPLATE_OVERRIDE_UTILS_KEY] = override_utils
+
+    add_template_link_entry(master_object, copy_object)
+
+
+def unlink_template(copy_object):
+    master_object = copy_object.get(TEMPLATE_MASTER_KEY)
+
+    for key in (TEMPLATE_MASTER_KEY, TEMPLATE_OVERRIDE_UTILS_KEY):
+        if key in copy_object:
+            del copy_object[key]
+
+    if isinstance(master_object, bpy.types.Object):
+        entry = template_links['masters'].get(master_object.as_pointer())
+        if entry is not None:
+            entry[1].pop(copy_object.as_pointer(), None)
+
+
+def push_template(master_object):
+    entry = template_links['masters'].get(master_object.as_pointer())
+    if entry is None:
+        return
+
+    for copy_key, copy_object in list(entry[1].items()):
+        try:
+            linked_master = copy_object.get(TEMPLATE_MASTER_KEY)
+        except ReferenceError:
+            entry[1].pop(copy_key)
+            continue
+
+        if linked_master != master_object:
+            entry[1].pop(copy_key)
+            continue
+
+        sync_modifier_values(master_object, copy_object, bool(copy_object.get(TEMPLATE_OVERRIDE_UTILS_KEY, False)))
+        copy_object.update_tag()
+
+    entry[2] = get_template_names(master_object)
+    entry[3] = get_template_signature(master_object)
+
+
+def push_template_links(object_updates):
+    # Links stored in the file keep working regardless of the current sync mode (which only
+    # decides how new copies are linked). The scan is cached until the next load, undo, or redo.
+    if not template_links['built']:
+        build_template_links()
+
+    masters = template_links['masters']
+    if not masters:
+        return
+
+    for key, object, update in object_updates:
+        entry = masters.get(key)
+        if entry is None:
+            continue
+
+        # Moving or selecting the master also reports an update, so the copies are only
+        # touched when one of its modifiers has actually changed. Changing a modifier's
+        # settings always flags a geometry update, so the full signature is only compared then.
+        names = get_template_names(object)
+        if names == entry[2] and not update.is_updated_geometry:
+            continue
+
+        if names != entry[2] or get_template_signature(object) != entry[3]:
+            push_template(object)
@@ -0,0 +1,117 @@
+# ███╗   ██╗██████╗
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝
+#
+# ND (Non-Destructive) Blender Add-on
+# Copyright (C) 2024 Tristan S. & Ian J. (HugeMenace)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+from mathutils.geometry import normal
+from . lazy import numpy
+
+
+# Topology classifications of evaluated meshes, keyed by the (original) object's pointer.
+# Entries are dropped whenever the depsgraph reports a geometry update for the object,
+# and are additionally checked against the evaluated mesh's element counts.
+topology_cache = {}
+
+
+def get_mesh_counts(mesh):
+    return (mesh.as_pointer(), len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons))
+
+
+def is_mesh_planar(mesh, tolerance=0.0001):
+    # Equivalent to lib.objects.is_planar, but reads the mesh in bulk rather than via bmesh.
+    if len(mesh.polygons) < 1:
+        return True
+
+    head = mesh.polygons[0]
+    if len(mesh.polygons) == 1 and head.loop_total == 3:
+        return True
+
+    coords = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float64)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3)
+
+    head_verts = head.vertices[:3]
+    origin = coords[head_verts[0]]
+    plane_normal = numpy.array(normal([coords[v] for v in head_verts]))
+
+    loop_verts = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    # Only the loops of the remaining faces are tested against the first face's plane.
+    head_loops = numpy.zeros(len(mesh.loops), dtype=bool)
+    head_loops[head.loop_start:head.loop_start + head.loop_total] = True
+    tail_verts = numpy.unique(loop_verts[~head_loops])
+
+    distances = (coords[tail_verts] - origin) @ plane_normal
+
+    return bool((numpy.abs(distances) < tolerance).all())
+
+
+def classify_mesh(mesh):
+    face_count = len(mesh.polygons)
+    edge_count = len(mesh.edges)
+
+    if edge_count > 0 and face_count > 0:
+        loop_edges = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+        mesh.loops.foreach_get("edge_index", loop_edges)
+        edge_face_counts = numpy.bincount(loop_edges, minlength=edge_count)
+
+        manifold = bool((edge_face_counts == 2).all())
+        has_loose_edges = not manifold and bool((edge_face_counts == 0).any())
+    else:
+        manifold = edge_count == 0
+        has_loose_edges = edge_count > 0
+
+    return {
+        'sketch': face_count >= 1 and is_mesh_planar(mesh),
+        'profile': face_count == 0 and edge_count > 0,
+        'has_faces': face_count >= 1,
+        'manifold': manifold,
+        'has_loose_edges': has_loose_edges,
+    }
+
+
+def get_topology(object, depsgraph):
+    mesh = object.evaluated_get(depsgraph).data
+    counts = get_mesh_counts(mesh)
+
+    cached = topology_cache.get(object.as_pointer())
+    if cached is not None and cached[0] == counts:
+        return cached[1]
+
+    topology = classify_mesh(mesh)
+    topology_cache[object.as_pointer()] = (counts, topology)
+
+    return topology
+
+
+def invalidate_topology_cache(object_updates):
+    for key, object, update in object_updates:
+        if update.is_updated_geometry:
+            topology_cache.pop(key, None)
+
+
+def clear_topology_cache():
+    topology_cache.clear()
@@ -27,11 +27,14 @@
 
 import bpy
 import re
-import requests
+import threading
 
 
 def update_available(version_tuple):
     try:
+        # Imported here, as requests is slow to import and only needed for the update check.
+        import requests
+
         response = requests.get('https://hugemenace.co/api/products/nd/version', timeout=2)
 
         if response.status_code == 200:
@@ -44,3 +47,25 @@ def update_available(version_tuple):
             return False
     except:
         return False
+
+
+def check_for_update_async(version_tuple, callback):
+    # The request is made on a background thread so it never blocks Blender's startup,
+    # the callback is then run on the main thread via a timer once it has completed.
+    result = {}
+
+    def check():
+        result['update_available'] = update_available(version_tuple)
+
+    thread = threading.Thread(target=check, daemon=True)
+    thread.start()
+
+    def poll():
+        if thread.is_alive():
+            return 0.5
+
+        callback(result.get('update_available', False))
+
+        return None
+
+    bpy.app.timers.register(poll, first_interval=0.5)
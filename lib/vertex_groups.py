@@ -0,0 +1,133 @@
+# ███╗   ██╗██████╗
+# ████╗  ██║██╔══██╗
+# ██╔██╗ ██║██║  ██║
+# ██║╚██╗██║██║  ██║
+# ██║ ╚████║██████╔╝
+# ╚═╝  ╚═══╝╚═════╝
+#
+# ND (Non-Destructive) Blender Add-on
+# Copyright (C) 2024 Tristan S. & Ian J. (HugeMenace)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ---
+# Contributors: Tristo (HM)
+# ---
+
+import bmesh
+from . lazy import numpy
+
+
+# Vertex group memberships are read in a single pass over the mesh (or edit-mode bmesh)
+# into a map of group index -> (member vertex indices, weights), which can then answer
+# any number of membership queries without walking the mesh again.
+def build_vertex_group_index(obj, bm=None):
+    groups = []
+    verts = []
+    weights = []
+
+    if bm is not None:
+        deform_layer = bm.verts.layers.deform.active
+        if deform_layer is not None:
+            for vert in bm.verts:
+                for group_index, weight in vert[deform_layer].items():
+                    groups.append(group_index)
+                    verts.append(vert.index)
+                    weights.append(weight)
+    else:
+        for vert in obj.data.vertices:
+            for element in vert.groups:
+                groups.append(element.group)
+                verts.append(vert.index)
+                weights.append(element.weight)
+
+    groups = numpy.array(groups, dtype=numpy.int32)
+    verts = numpy.array(verts, dtype=numpy.int32)
+    weights = numpy.array(weights, dtype=numpy.float32)
+
+    order = numpy.argsort(groups, kind='stable')
+    groups, verts, weights = groups[order], verts[order], weights[order]
+
+    group_indices, starts = numpy.unique(groups, return_index=True)
+    ends = numpy.append(starts[1:], len(groups))
+
+    return {int(group): (verts[start:end], weights[start:end]) for group, start, end in zip(group_indices, starts, ends)}
+
+
+def get_vertex_group_members(vgroup_index, group_index):
+    members = vgroup_index.get(group_index)
+    if members is None:
+        return numpy.empty(0, dtype=numpy.int32)
+
+    return members[0]
+
+
+def get_vertex_groups_touching(vgroup_index, vert_indices):
+    vert_indices = numpy.asarray(vert_indices, dtype=numpy.int32)
+
+    return [group for group, (verts, _) in sorted(vgroup_index.items()) if numpy.isin(verts, vert_indices).any()]
+
+
+def is_vertex_group_empty(vgroup_index, group_index):
+    members = vgroup_index.get(group_index)
+
+    return members is None or not (members[1] > 0).any()
+
+
+# Membership writes follow the same split; in edit mode they go straight through the
+# bmesh deform layer, otherwise through the vertex group API in bulk.
+def set_vertex_group_weights(obj, group, vert_indices, weight=1.0):
+    mesh = obj.data
+    vert_indices = list(vert_indices)
+
+    if not mesh.is_editmode:
+        group.add(vert_indices, weight, 'REPLACE')
+        return
+
+    bm = bmesh.from_edit_mesh(mesh)
+    bm.verts.ensure_lookup_table()
+    deform_layer = bm.verts.layers.deform.verify()
+
+    for i in vert_indices:
+        bm.verts[i][deform_layer][group.index] = weight
+
+    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+
+
+def remove_from_vertex_groups(obj, vert_indices, groups=None):
+    # Removes the vertices from the given groups (or every group when none are given).
+    mesh = obj.data
+    vert_indices = list(vert_indices)
+    groups = list(obj.vertex_groups) if groups is None else list(groups)
+
+    if not mesh.is_editmode:
+        for group in groups:
+            group.remove(vert_indices)
+        return
+
+    bm = bmesh.from_edit_mesh(mesh)
+    deform_layer = bm.verts.layers.deform.active
+    if deform_layer is None:
+        return
+
+    bm.verts.ensure_lookup_table()
+    group_indices = [group.index for group in groups]
+
+    for i in vert_indices:
+        deform_vert = bm.verts[i][deform_layer]
+        for group_index in group_indices:
+            if group_index in deform_vert:
+                del deform_vert[group_index]
+
+    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
@@ -27,7 +27,6 @@
 
 import bpy
 import bmesh
-import numpy
 from random import choice
 from .. lib.polling import ctx_edit_mode, ctx_multi_mode, list_ok
 
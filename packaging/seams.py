@@ -26,22 +26,23 @@
 # ---
 
 import bpy
-import bmesh
 from math import radians, degrees
+from .. lib.lazy import numpy
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream
-from .. lib.modifiers import add_smooth_by_angle, set_smoothing_angle
-from .. lib.objects import get_real_active_object
-from .. lib.polling import ctx_obj_mode, obj_is_mesh, ctx_objects_selected, app_minor_version
+from .. lib.points import init_points, register_points_handler, unregister_points_handler
+from .. lib.modifiers import add_smooth_by_angle_batch, set_smoothing_angle_batch
+from .. lib.attributes import get_edge_face_angles, get_edge_seams, set_edge_seams, get_edge_sharps, set_edge_sharps, get_edge_world_coords
+from .. lib.polling import ctx_obj_mode, list_ok, app_minor_version
 
 
 class ND_OT_seams(BaseOperator):
     bl_idname = "nd.seams"
     bl_label = "UV Seams"
-    bl_description = """Interactively set UV seams & sharp edges
+    bl_description = """Interactively set UV seams & sharp edges on the selected objects
 SHIFT — Skip interactive mode and immediately apply the default settings"""
     bl_options = {'UNDO'}
 
@@ -59,8 +60,8 @@ SHIFT — Skip interactive mode and immediately apply the default settings"""
 
     @classmethod
     def poll(cls, context):
-        target_object = get_real_active_object(context)
-        return ctx_obj_mode(context) and obj_is_mesh(target_object) and ctx_objects_selected(context, 1)
+        valid_objects = cls.get_valid_objects(cls, context)
+        return ctx_obj_mode(context) and list_ok(valid_objects)
 
 
     def do_modal(self, context, event):
@@ -89,7 +90,7 @@ SHIFT — Skip interactive mode and immediately apply the default settings"""
                 self.angle = max(0, self.angle - angle_factor)
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.angle_input_stream) and self.key_no_modifiers:
                 self.angle = max(0, min(180, self.angle + self.mouse_value_mag))
                 self.mark_dirty()
@@ -108,9 +109,11 @@ SHIFT — Skip interactive mode and immediately apply the default settings"""
         self.angle_input_stream = new_stream()
 
         self.target_object = context.active_object
+        self.target_objects = self.get_valid_objects(context)
 
-        bpy.ops.object.mode_set_with_submode(mode='EDIT', mesh_select_mode={'EDGE'})
-        bpy.ops.mesh.select_all(action='DESELECT')
+        self.cache_edge_data(context)
+
+        init_points(self)
 
         self.operate(context)
 
@@ -122,6 +125,7 @@ SHIFT — Skip interactive mode and immediately apply the default settings"""
 
         init_overlay(self, event)
         register_draw_handler(self, draw_text_callback)
+        register_points_handler(self)
 
         context.window_manager.modal_handler_add(self)
 
@@ -132,46 +136,67 @@ SHIFT — Skip interactive mode and immediately apply the default settings"""
         self.commit_auto_smooth = not self.commit_auto_smooth
 
 
-    def operate(self, context):
-        self.clear_edges(context)
+    def get_valid_objects(self, context):
+        return [obj for obj in context.selected_objects if obj.type == 'MESH']
 
-        bpy.ops.mesh.edges_select_sharp(sharpness=radians(self.angle))
 
-        bpy.ops.mesh.mark_seam(clear=False)
-        bpy.ops.mesh.mark_sharp(clear=False)
+    def cache_edge_data(self, context):
+        # Face angles are computed once per mesh, so changing the angle only re-thresholds them.
+        self.edge_data = {}
+        for obj in self.target_objects:
+            if obj.data in self.edge_data:
+                continue
 
-        bpy.ops.mesh.select_all(action='DESELECT')
+            self.edge_data[obj.data] = {
+                'angles': get_edge_face_angles(obj.data),
+                'seams': get_edge_seams(obj.data),
+                'sharps': get_edge_sharps(obj.data),
+            }
 
+        self.edge_coords = [(obj.data, get_edge_world_coords(obj)) for obj in self.target_objects]
 
-    def clear_edges(self, context):
-        bpy.ops.mesh.select_all(action='SELECT')
 
-        bpy.ops.mesh.mark_seam(clear=True)
-        bpy.ops.mesh.mark_sharp(clear=True)
+    def operate(self, context):
+        sharpness = radians(self.angle)
 
-        bpy.ops.mesh.select_all(action='DESELECT')
+        for mesh, data in self.edge_data.items():
+            data['marked'] = data['angles'] > sharpness
 
+            set_edge_seams(mesh, data['marked'])
+            set_edge_sharps(mesh, data['marked'])
+            mesh.update()
 
-    def finish(self, context):
-        bpy.ops.object.mode_set(mode='OBJECT')
+        marked_coords = [coords[self.edge_data[mesh]['marked']] for mesh, coords in self.edge_coords]
+        self.guide_line = numpy.concatenate(marked_coords).reshape(-1, 3) if marked_coords else ()
 
+
+    def restore_edges(self, context):
+        for mesh, data in self.edge_data.items():
+            set_edge_seams(mesh, data['seams'])
+            set_edge_sharps(mesh, data['sharps'])
+            mesh.update()
+
+
+    def finish(self, context):
         if self.commit_auto_smooth:
             if app_minor_version() >= (4, 1):
-                add_smooth_by_angle(context, self.target_object)
-                set_smoothing_angle(context, self.target_object, radians(180), False)
+                add_smooth_by_angle_batch(context, self.target_objects)
+                set_smoothing_angle_batch(context, self.target_objects, radians(180), False)
             else:
                 bpy.ops.object.shade_smooth()
-                self.target_object.data.use_auto_smooth = True
-                self.target_object.data.auto_smooth_angle = radians(180)
+                for obj in self.target_objects:
+                    obj.data.use_auto_smooth = True
+                    obj.data.auto_smooth_angle = radians(180)
 
         unregister_draw_handler()
+        unregister_points_handler()
 
 
     def revert(self, context):
-        self.clear_edges(context)
-        bpy.ops.object.mode_set(mode='OBJECT')
+        self.restore_edges(context)
 
         unregister_draw_handler()
+        unregister_points_handler()
 
 
 def draw_text_callback(self):
@@ -199,3 +224,4 @@ def register():
 def unregister():
     bpy.utils.unregister_class(ND_OT_seams)
     unregister_draw_handler()
+    unregister_points_handler()
@@ -65,6 +65,7 @@ CTRL — Remove existing modifiers"""
         'MOVEMENT_PASSTHROUGH': True,
         'ON_CANCEL': lambda cls, context: cls.revert(context),
         'ON_CONFIRM': lambda cls, context: cls.finish(context),
+        'OPERATE_INTERVAL': 1 / 30,
     }
 
 
@@ -135,7 +136,7 @@ CTRL — Remove existing modifiers"""
                 self.axes[self.axis][IDX_OFFSET] = round_dec(self.axes[self.axis][IDX_OFFSET] - step)
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.count_streams[self.axis]) and self.key_no_modifiers and self.has_mouse_step:
                 if self.mouse_step > 0:
                     new_count = self.axes[self.axis][IDX_COUNT] + (1 if self.axes[self.axis][IDX_OFFSET] >= 0 else -1)
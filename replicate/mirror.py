@@ -34,7 +34,7 @@ from .. lib.events import capture_modifier_keys, pressed
 from .. lib.axis import init_axis, register_axis_handler, unregister_axis_handler
 from .. lib.viewport import set_3d_cursor
 from .. lib.math import v3_average, create_rotation_matrix_from_vertex, create_rotation_matrix_from_edge, create_rotation_matrix_from_face, v3_center
-from .. lib.modifiers import new_modifier, remove_modifiers_starting_with
+from .. lib.modifiers import new_modifier, move_mod_to_index, remove_modifiers_starting_with
 from .. lib.objects import get_real_active_object
 from .. lib.polling import obj_moddable, obj_is_curve, obj_exists, ctx_edit_mode, ctx_obj_mode, ctx_objects_selected, ctx_min_objects_selected, app_minor_version
 from .. lib.preferences import get_preferences
@@ -355,12 +355,7 @@ CTRL — Remove existing modifiers"""
             self.mirrors.append(mirror)
 
             if self.early_apply:
-                while obj.modifiers[0].name != mirror.name:
-                    if app_minor_version() < (4, 0):
-                        bpy.ops.object.modifier_move_up({'object': obj}, modifier=mirror.name)
-                    else:
-                        with bpy.context.temp_override(object=obj):
-                            bpy.ops.object.modifier_move_up(modifier=mirror.name)
+                move_mod_to_index(obj, mirror.name, 0)
 
 
     def operate(self, context):
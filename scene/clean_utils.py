@@ -26,14 +26,18 @@
 # ---
 
 import bpy
-from .. lib.collections import get_all_util_objects
-from .. lib.polling import ctx_obj_mode, app_minor_version
+from .. lib.collections import is_util_object
+from .. lib.modifiers import invalidate_modifier_index
+from .. lib.references import get_object_references
+from .. lib.polling import ctx_obj_mode
 
 
 class ND_OT_clean_utils(bpy.types.Operator):
     bl_idname = "nd.clean_utils"
     bl_label = "Clean Utils"
-    bl_description = "Removes unused boolean modifiers and utility objects"
+    bl_description = """Removes unused boolean modifiers and utility objects
+SHIFT — Report what would be removed without removing anything"""
+    bl_options = {'UNDO'}
 
 
     @classmethod
@@ -42,70 +46,111 @@ class ND_OT_clean_utils(bpy.types.Operator):
 
 
     def invoke(self, context, event):
-        while self.remove_utils() > 0:
-            continue
+        dry_run = event.shift
+
+        remove_mods, dead_utils = self.find_unused(context)
+
+        if dry_run:
+            self.report_unused(remove_mods, dead_utils)
+            return {'FINISHED'}
+
+        for obj, mod in remove_mods:
+            obj.modifiers.remove(mod)
+            invalidate_modifier_index(obj)
+
+        remove_objects(context, dead_utils)
 
         return {'FINISHED'}
 
 
-    def remove_utils(self):
-        removal_count = 0
+    def get_references(self, obj, remove_mods):
+        # Reference discovery is shared with lib.references, except that disabled or empty
+        # boolean modifiers are queued for removal and don't keep their utils alive.
+        references = []
+
+        for mod in getattr(obj, 'modifiers', ()):
+            if mod.type == 'BOOLEAN' and not (mod.show_viewport and mod.object):
+                remove_mods.append((obj, mod))
+                continue
+
+            references.extend(get_object_references(mod))
+
+        for constraint in obj.constraints:
+            references.extend(get_object_references(constraint))
 
-        active_util_object_names = set()
-        all_scene_objects = [obj for obj in bpy.context.view_layer.objects if obj.type == 'MESH']
-        util_mods = ['BOOLEAN', 'ARRAY', 'MIRROR', 'LATTICE']
+        return references
 
-        for obj in all_scene_objects:
-            remove_mods = []
-            for mod in obj.modifiers:
-                if mod.type not in util_mods:
-                    continue
 
-                if mod.type == 'BOOLEAN':
-                    if mod.show_viewport and mod.object:
-                        active_util_object_names.add(mod.object.name)
-                    else:
-                        remove_mods.append(mod)
-                        removal_count += 1
-                    continue
+    def find_unused(self, context):
+        # Build the object -> referenced object graph in a single pass over the view layer,
+        # then mark every util reachable from a regular (non-util) object of any type as live.
+        # Utils that are only referenced by other unused utils (at any depth) are left unmarked.
+        remove_mods = []
+        graph = {}
+        worklist = []
+        util_objects = []
 
-                if mod.type == 'ARRAY':
-                    if mod.offset_object:
-                        active_util_object_names.add(mod.offset_object.name)
-                    continue
+        for obj in context.view_layer.objects:
+            graph[obj] = self.get_references(obj, remove_mods)
 
-                if mod.type == 'LATTICE':
-                    if mod.object:
-                        active_util_object_names.add(mod.object.name)
-                    continue
+            if is_util_object(obj):
+                util_objects.append(obj)
+            else:
+                worklist.append(obj)
 
-                if mod.type == 'MIRROR':
-                    if mod.mirror_object:
-                        active_util_object_names.add(mod.mirror_object.name)
-                    continue
+        live_objects = set(worklist)
+        while worklist:
+            for reference in graph.get(worklist.pop(), ()):
+                if reference not in live_objects:
+                    live_objects.add(reference)
+                    worklist.append(reference)
 
-            for mod in remove_mods:
-                obj.modifiers.remove(mod)
+        dead_utils = [obj for obj in util_objects if obj not in live_objects]
+        dead_util_set = set(dead_utils)
 
-            for constraint in obj.constraints:
-                if hasattr(constraint, 'target') and constraint.target:
-                    active_util_object_names.add(constraint.target.name)
+        # Modifiers on utils that are about to be removed don't need removing individually.
+        remove_mods = [(obj, mod) for obj, mod in remove_mods if obj not in dead_util_set]
 
-        all_util_objects = get_all_util_objects()
-        deleted_objects = []
+        return remove_mods, dead_utils
 
-        for obj in all_util_objects:
-            if obj and obj.name not in active_util_object_names:
-                deleted_objects.append(obj)
-                removal_count += 1
 
-        if app_minor_version() < (4, 0):
-            bpy.ops.object.delete({'active_object': None, 'object': None, 'selected_objects': deleted_objects}, use_global=False)
+    def report_unused(self, remove_mods, dead_utils):
+        if not remove_mods and not dead_utils:
+            self.report({'INFO'}, "Nothing to clean up.")
+            return
+
+        mod_names = ", ".join(f"{obj.name} › {mod.name}" for obj, mod in remove_mods) or "None"
+        util_names = ", ".join(obj.name for obj in dead_utils) or "None"
+
+        # Blender only displays the last report, so everything goes into a single message.
+        self.report({'INFO'}, f"Would remove {len(remove_mods)} modifier(s): {mod_names} | {len(dead_utils)} util(s): {util_names}")
+
+
+def remove_objects(context, objects):
+    scene_collections = set([context.scene.collection, *context.scene.collection.children_recursive])
+
+    removable_objects = []
+    for obj in objects:
+        # Objects that are also used by other scenes are only unlinked from this one.
+        if len(obj.users_scene) > 1:
+            for collection in [c for c in obj.users_collection if c in scene_collections]:
+                collection.objects.unlink(obj)
         else:
-            with bpy.context.temp_override(active_object=None, object=None, selected_objects=deleted_objects):
-                bpy.ops.object.delete(use_global=False)
+            removable_objects.append(obj)
+
+    # Keep any surviving children where they are once their parent is removed.
+    removable_set = set(removable_objects)
+    for obj in removable_objects:
+        for child in obj.children:
+            if child not in removable_set:
+                matrix_world = child.matrix_world.copy()
+                child.parent = None
+                child.matrix_world = matrix_world
+
+    object_data = set(obj.data for obj in removable_objects if obj.data)
 
-        return removal_count
+    bpy.data.batch_remove(removable_objects)
+    bpy.data.batch_remove([data for data in object_data if data.users == 0])
 
 
 def register():
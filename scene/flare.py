@@ -31,7 +31,6 @@ from random import random, uniform, randrange
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
-from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream
 from .. lib.objects import get_real_active_object
 from .. lib.polling import ctx_obj_mode, obj_is, ctx_objects_selected
@@ -131,7 +130,7 @@ class ND_OT_flare(BaseOperator):
                 self.energy_offset -= energy_factor
             self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.height_offset_input_stream) and self.key_alt:
                 self.height_offset += self.mouse_value
             elif no_stream(self.scale_input_stream) and self.key_ctrl:
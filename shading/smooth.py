@@ -33,7 +33,7 @@ from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, tog
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.preferences import get_preferences
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream
-from .. lib.modifiers import add_smooth_by_angle, set_smoothing_angle
+from .. lib.modifiers import add_smooth_by_angle_batch, set_smoothing_angle_batch
 from .. lib.polling import ctx_obj_mode, list_ok, app_minor_version
 
 
@@ -87,7 +87,7 @@ class ND_OT_smooth(BaseOperator):
             self.ignore_sharpness = not self.ignore_sharpness
             self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.angle_input_stream) and self.key_no_modifiers:
                 self.angle = max(0, min(180, self.angle + self.mouse_value_mag))
                 self.mark_dirty()
@@ -121,8 +121,7 @@ class ND_OT_smooth(BaseOperator):
 
     def add_smooth_shading(self, context):
         if app_minor_version() >= (4, 1):
-            for obj in self.valid_objects:
-                add_smooth_by_angle(context, obj)
+            add_smooth_by_angle_batch(context, self.valid_objects)
             return
 
         bpy.ops.object.shade_smooth()
@@ -133,8 +132,7 @@ class ND_OT_smooth(BaseOperator):
 
     def operate(self, context):
         if app_minor_version() >= (4, 1):
-            for obj in self.valid_objects:
-                set_smoothing_angle(context, obj, radians(self.angle), self.ignore_sharpness)
+            set_smoothing_angle_batch(context, self.valid_objects, radians(self.angle), self.ignore_sharpness)
         else:
             for obj in context.selected_objects:
                 if obj.type != 'MESH':
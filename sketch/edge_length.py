@@ -28,14 +28,15 @@
 import bpy
 import bmesh
 from math import radians
+from .. lib.lazy import numpy
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import init_overlay, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
-from .. lib.preferences import get_preferences, get_scene_unit_factor
+from .. lib.preferences import get_scene_unit_factor
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream, set_stream
 from .. lib.objects import get_real_active_object
 from .. lib.polling import ctx_edit_mode, obj_is_mesh, ctx_objects_selected, app_minor_version
-from .. lib.math import v3_distance, v3_average, v3_direction, round_dec
+from .. lib.math import v3_distance, round_dec
 from .. lib.points import init_points, register_points_handler, unregister_points_handler
 
 
@@ -90,7 +91,7 @@ class ND_OT_edge_length(BaseOperator):
                 self.distance = round_dec(self.distance - self.step_size)
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if no_stream(self.distance_input_stream) and self.key_no_modifiers:
                 self.distance = max(0, self.distance + self.mouse_value) if not self.offset_distance else self.distance + self.mouse_value
                 self.mark_dirty()
@@ -139,19 +140,19 @@ class ND_OT_edge_length(BaseOperator):
                 [selected_verts[1].index, selected_verts[0].index]
             ]
 
-        self.current_positions = [[
-            self.bm.verts[vert_pair[0]].co,
-            self.bm.verts[vert_pair[1]].co
-        ] for vert_pair in self.selected_vertex_pairs]
+        self.vert_pairs = [(self.bm.verts[vert_pair[0]], self.bm.verts[vert_pair[1]]) for vert_pair in self.selected_vertex_pairs]
 
-        self.starting_positions = [[
-            self.bm.verts[vert_pair[0]].co.copy(),
-            self.bm.verts[vert_pair[1]].co.copy()
-        ] for vert_pair in self.selected_vertex_pairs]
+        self.starting_positions = numpy.array([(vert_0.co, vert_1.co) for vert_0, vert_1 in self.vert_pairs], dtype=numpy.float64)
+        self.midpoints = self.starting_positions.mean(axis=1)
 
-        self.midpoints = [v3_average(pos_pair) for pos_pair in self.starting_positions]
-        self.directions = [v3_direction(pos_pair[0], pos_pair[1]) for pos_pair in self.starting_positions]
-        self.starting_distances = [v3_distance(pos_pair[0], pos_pair[1]) for pos_pair in self.starting_positions]
+        offsets = self.starting_positions[:, 1] - self.starting_positions[:, 0]
+        lengths = numpy.linalg.norm(offsets, axis=1)
+        self.directions = offsets / numpy.where(lengths > 0, lengths, 1)[:, None]
+        self.starting_distances = lengths.tolist()
+
+        world_matrix = numpy.array(self.world_matrix, dtype=numpy.float64)
+        self.world_rotation = world_matrix[:3, :3].T
+        self.world_translation = world_matrix[:3, 3]
 
         if not self.offset_distance:
             self.distance = sum(self.starting_distances) / len(self.starting_distances)
@@ -182,39 +183,49 @@ class ND_OT_edge_length(BaseOperator):
         self.distance += absolute_distance if not self.offset_distance else offset_distance
 
 
-    def move_verts(self, context, vertex_pair, index):
-        vertex_0 = self.bm.verts[vertex_pair[0]]
-        vertex_1 = self.bm.verts[vertex_pair[1]]
+    def move_verts(self, context):
+        # New positions for every selected pair are computed together, written back,
+        # and followed by a single edit-mesh update rather than one per pair.
+        distance = self.directions * self.get_distance()
+        positions = self.starting_positions.copy()
 
         match self.current_anchor:
             case 0:
-                vertex_0.co = self.get_reference_position(vertex_pair, index, 1) - self.directions[index] * self.get_distance()
-                vertex_1.co = self.get_reference_position(vertex_pair, index, 0) + self.directions[index] * self.get_distance()
+                positions[:, 0] = self.get_reference_positions(1) - distance
+                positions[:, 1] = self.get_reference_positions(0) + distance
             case 1:
-                vertex_0.co = self.starting_positions[index][0]
-                vertex_1.co = self.get_reference_position(vertex_pair, index, 0) + self.directions[index] * self.get_distance()
+                positions[:, 1] = self.get_reference_positions(0) + distance
             case 2:
-                vertex_1.co = self.starting_positions[index][1]
-                vertex_0.co = self.get_reference_position(vertex_pair, index, 1) - self.directions[index] * self.get_distance()
+                positions[:, 0] = self.get_reference_positions(1) - distance
+
+        for (vertex_0, vertex_1), (co_0, co_1) in zip(self.vert_pairs, positions.tolist()):
+            vertex_0.co = co_0
+            vertex_1.co = co_1
 
         bmesh.update_edit_mesh(context.active_object.data)
 
+        self.current_positions = positions
+
 
     def get_distance(self ):
         return self.distance if not self.current_anchor == 0 else self.distance / 2
 
 
-    def get_reference_position(self, vertex_pair, pos_index, vert_index):
+    def get_reference_positions(self, vert_index):
         if self.revert_distance:
-            return self.bm.verts[vertex_pair[vert_index]].co
+            return numpy.array([vert_pair[vert_index].co for vert_pair in self.vert_pairs], dtype=numpy.float64)
 
         if self.offset_distance:
-            return self.starting_positions[pos_index][not vert_index]
+            return self.starting_positions[:, int(not vert_index)]
 
         if self.current_anchor == 0:
-            return self.midpoints[pos_index]
+            return self.midpoints
+
+        return self.starting_positions[:, vert_index]
+
 
-        return self.starting_positions[pos_index][vert_index]
+    def to_world(self, coords):
+        return coords @ self.world_rotation + self.world_translation
 
 
     def compare_distance_to_cursor(self, context, coords_0, coords_1):
@@ -223,33 +234,19 @@ class ND_OT_edge_length(BaseOperator):
 
 
     def operate(self, context):
-        for index, vertex_pair in enumerate(self.selected_vertex_pairs):
-            self.move_verts(context, vertex_pair, index)
+        self.move_verts(context)
 
         if self.current_anchor == 0:
-            self.secondary_points = [self.world_matrix @ point for point in self.midpoints]
-            self.primary_points = []
-            for index, vertex_pair in enumerate(self.selected_vertex_pairs):
-                self.primary_points.extend([
-                    self.world_matrix @ self.bm.verts[vertex_pair[0]].co,
-                    self.world_matrix @ self.bm.verts[vertex_pair[1]].co
-                ])
+            self.secondary_points = self.to_world(self.midpoints)
+            self.primary_points = self.to_world(self.current_positions.reshape(-1, 3))
 
         if self.current_anchor == 1:
-            self.secondary_points = [self.world_matrix @ point[0] for point in self.starting_positions]
-            self.primary_points = []
-            for index, vertex_pair in enumerate(self.selected_vertex_pairs):
-                self.primary_points.extend([
-                    self.world_matrix @ self.bm.verts[vertex_pair[1]].co,
-                ])
+            self.secondary_points = self.to_world(self.starting_positions[:, 0])
+            self.primary_points = self.to_world(self.current_positions[:, 1])
 
         if self.current_anchor == 2:
-            self.secondary_points = [self.world_matrix @ point[1] for point in self.starting_positions]
-            self.primary_points = []
-            for index, vertex_pair in enumerate(self.selected_vertex_pairs):
-                self.primary_points.extend([
-                    self.world_matrix @ self.bm.verts[vertex_pair[0]].co,
-                ])
+            self.secondary_points = self.to_world(self.starting_positions[:, 1])
+            self.primary_points = self.to_world(self.current_positions[:, 0])
 
 
     def finish(self, context):
@@ -32,7 +32,6 @@ from mathutils import Matrix
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_hint, draw_property, draw_hint
 from .. lib.viewport import set_3d_cursor
-from .. lib.preferences import get_preferences
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.numeric_input import update_stream, no_stream, get_stream_value, new_stream, has_stream
 from .. lib.objects import create_duplicate_liftable_geometry, get_real_active_object
@@ -105,7 +104,7 @@ SHIFT — Do not clean duplicate mesh before extraction"""
         if self.stage == 0 and self.key_select:
             return {'PASS_THROUGH'}
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if self.stage == 1:
                 if no_stream(self.inset_input_stream) and self.key_no_modifiers:
                     self.inset = max(0, self.inset + self.mouse_value)
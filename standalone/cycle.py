@@ -31,8 +31,9 @@ from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.collections import isolate_utils, hide_all_utils
-from .. lib.preferences import get_preferences
 from .. lib.objects import get_real_active_object
+from .. lib.preferences import get_preferences
+from .. lib.modifiers import begin_boolean_preview, end_boolean_preview
 from .. lib.polling import ctx_obj_mode, obj_is_mesh, ctx_objects_selected, app_minor_version
 
 
@@ -82,7 +83,7 @@ SHIFT — Cycle through the modifier stack"""
                 self.util_current_index = (self.util_current_index - 1) % self.util_count
                 self.mark_dirty()
 
-        if get_preferences().enable_mouse_values:
+        if self.prefs.enable_mouse_values:
             if self.mod_cycle and self.has_mouse_step:
                 self.mod_current_index = max(-1, min(self.mod_current_index + self.mouse_step, self.mod_count - 1))
                 self.mark_dirty()
@@ -114,6 +115,10 @@ SHIFT — Cycle through the modifier stack"""
         self.util_mod_names = [mod.name for mod in self.util_mods]
         self.util_count = len(self.util_mods)
 
+        self.boolean_preview = []
+        if get_preferences().use_fast_boolean_previews:
+            self.boolean_preview = begin_boolean_preview(self.target_obj.modifiers)
+
         self.mod_current_index = -1
         self.util_current_index = 0
 
@@ -232,6 +237,8 @@ SHIFT — Cycle through the modifier stack"""
 
 
     def finish(self, context):
+        end_boolean_preview(self.boolean_preview)
+
         if self.mod_cycle and not self.freeze_mod_cycle_state:
             self.revert_mods(context)
 
@@ -259,6 +266,8 @@ SHIFT — Cycle through the modifier stack"""
 
 
     def revert(self, context):
+        end_boolean_preview(self.boolean_preview)
+
         self.revert_mods(context)
         self.target_obj.show_wire = self.show_wireframe_prev
 
@@ -26,9 +26,10 @@
 # ---
 
 import bpy
-import bmesh
 from .. lib.polling import ctx_obj_mode, list_ok, app_minor_version
-from .. lib.modifiers import is_sba_mod
+from .. lib.attributes import clear_bevel_weights, remove_nd_edge_attributes
+from .. lib.modifiers import is_sba_mod, bake_modifiers, get_modifier_stack_signature
+from .. lib.objects import replace_mesh
 
 
 class ND_OT_apply_modifiers(bpy.types.Operator):
@@ -62,14 +63,19 @@ ALT — Duplicate the mesh before applying modifiers"""
             bpy.ops.object.duplicate()
             valid_objects = context.selected_objects.copy()
 
-        bpy.ops.object.make_single_user(object=True, obdata=True, material=False, animation=False, obdata_animation=False)
+        bpy.ops.object.make_single_user(object=True, obdata=False, material=False, animation=False, obdata_animation=False)
 
         mesh_objects = [obj for obj in valid_objects if obj.type == 'MESH']
-        for obj in mesh_objects:
-            self.collapse_modifiers(obj)
-            if self.apply_mode != 'SOFT':
+        self.collapse_modifiers(context, mesh_objects)
+
+        if self.apply_mode != 'SOFT':
+            mesh_users = {}
+            for obj in mesh_objects:
                 self.remove_vertex_groups(obj)
-                self.remove_edge_weights(obj)
+                mesh_users.setdefault(obj.data, []).append(obj)
+
+            for mesh, objs in mesh_users.items():
+                self.remove_edge_weights(mesh, objs)
 
         curve_objects = [obj for obj in valid_objects if obj.type == 'CURVE']
         if len(curve_objects) > 0:
@@ -98,7 +104,7 @@ ALT — Duplicate the mesh before applying modifiers"""
         return self.execute(context)
 
 
-    def collapse_modifiers(self, obj):
+    def get_apply_plan(self, obj):
         safe_mod_types = ['WEIGHTED_NORMAL', 'TRIANGULATE']
 
         mods = [mod for mod in obj.modifiers]
@@ -133,28 +139,40 @@ ALT — Duplicate the mesh before applying modifiers"""
                 else:
                     mods_to_apply.append(mod.name)
 
-        for mod_name in mods_to_apply:
-            try:
-                if app_minor_version() < (4, 0):
-                    bpy.ops.object.modifier_apply({'object': obj}, modifier=mod_name)
-                else:
-                    with bpy.context.temp_override(object=obj):
-                        bpy.ops.object.modifier_apply(modifier=mod_name)
-            except:
-                # If the modifier is disabled, just remove it.
-                if app_minor_version() < (4, 0):
-                    bpy.ops.object.modifier_remove({'object': obj}, modifier=mod_name)
-                else:
-                    with bpy.context.temp_override(object=obj):
-                        bpy.ops.object.modifier_remove(modifier=mod_name)
+        return mods_to_apply, mods_to_remove
+
+
+    def collapse_modifiers(self, context, objs):
+        plans = [(obj, *self.get_apply_plan(obj)) for obj in objs]
 
+        # Objects that share a mesh and would apply an identical modifier stack produce
+        # the same result, so only one member of each group is evaluated and the baked
+        # mesh is shared between all of them (rather than making every object single user).
+        groups = {}
+        for obj, mods_to_apply, _ in plans:
+            key = (obj.data, get_modifier_stack_signature(obj, mods_to_apply) if mods_to_apply else None)
+            groups.setdefault(key, (mods_to_apply, []))[1].append(obj)
+
+        targets = [(members[0], mods_to_apply) for mods_to_apply, members in groups.values() if mods_to_apply]
+        meshes = bake_modifiers(context, targets)
+
+        baked_groups = [members for mods_to_apply, members in groups.values() if mods_to_apply]
+        for members, mesh in zip(baked_groups, meshes):
+            replace_mesh(members, mesh)
+
+        # Unbaked meshes still have their edge weights cleared, so detach them from
+        # any objects outside of the group first.
         if self.apply_mode != 'SOFT':
-            for mod_name in mods_to_remove:
-                if app_minor_version() < (4, 0):
-                    bpy.ops.object.modifier_remove({'object': obj}, modifier=mod_name)
-                else:
-                    with bpy.context.temp_override(object=obj):
-                        bpy.ops.object.modifier_remove(modifier=mod_name)
+            for (mesh, _), (mods_to_apply, members) in groups.items():
+                if not mods_to_apply and mesh.users > len(members):
+                    replace_mesh(members, mesh.copy())
+
+        for obj, mods_to_apply, mods_to_remove in plans:
+            mod_names = mods_to_apply + (mods_to_remove if self.apply_mode != 'SOFT' else [])
+            for mod_name in mod_names:
+                mod = obj.modifiers.get(mod_name)
+                if mod:
+                    obj.modifiers.remove(mod)
 
 
     def remove_vertex_groups(self, obj):
@@ -165,24 +183,16 @@ ALT — Duplicate the mesh before applying modifiers"""
             obj.vertex_groups.remove(vg)
 
 
-    def remove_edge_weights(self, obj):
-        bm = bmesh.new()
-        bm.from_mesh(obj.data)
-
-        bevel_weight_layer = None
-
-        if app_minor_version() < (4, 0):
-            bevel_weight_layer = bm.edges.layers.bevel_weight.verify()
-        else:
-            bevel_weight_layer = bm.edges.layers.float.get("bevel_weight_edge", None)
+    def remove_edge_weights(self, mesh, objs):
+        clear_bevel_weights(mesh)
 
-        if bevel_weight_layer is not None:
-            edges = list(bm.edges)
-            for edge in edges:
-                edge[bevel_weight_layer] = 0
+        # Keep any ND attribute-based bevel weights still driving a (skipped) bevel modifier.
+        # Bevel modifiers only reference an edge weight attribute from Blender 4.3 onwards.
+        used_attributes = set()
+        if app_minor_version() >= (4, 3):
+            used_attributes = {mod.edge_weight for obj in objs for mod in obj.modifiers if mod.type == 'BEVEL' and mod.edge_weight}
 
-        bm.to_mesh(obj.data)
-        bm.free()
+        remove_nd_edge_attributes(mesh, keep=used_attributes)
 
 
 def register():
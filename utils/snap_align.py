@@ -26,14 +26,13 @@
 # ---
 
 import bpy
-import bmesh
-from numpy.linalg import norm
-from bpy_extras.view3d_utils import region_2d_to_vector_3d, region_2d_to_origin_3d
 from .. lib.base_operator import BaseOperator
 from .. lib.overlay import update_overlay, init_overlay, toggle_pin_overlay, toggle_operator_passthrough, register_draw_handler, unregister_draw_handler, draw_header, draw_property, draw_hint
 from .. lib.events import capture_modifier_keys, pressed
 from .. lib.points import init_points, register_points_handler, unregister_points_handler
-from .. lib.math import v3_average, v3_distance, create_rotation_matrix_from_vertex, create_rotation_matrix_from_edge, create_rotation_matrix_from_face
+from .. lib.math import v3_average
+from .. lib.snapping import get_snap_index, find_snap_points
+from .. lib.raycast import get_surface_bvh, ray_cast_object_from_mouse
 from .. lib.objects import get_real_active_object
 from .. lib.polling import ctx_obj_mode, obj_is_mesh, ctx_objects_selected
 
@@ -93,36 +92,9 @@ class ND_OT_snap_align(BaseOperator):
                 mod.show_viewport = False
 
         depsgraph = context.evaluated_depsgraph_get()
-        object_eval = context.active_object.evaluated_get(depsgraph)
-
-        bm = bmesh.new()
-        bm.from_mesh(object_eval.data)
-
-        world_matrix = context.active_object.matrix_world
-
-        vert_points = []
-        for vert in bm.verts:
-            vert_matrix = create_rotation_matrix_from_vertex(world_matrix, vert)
-            vert_points.append((world_matrix @ vert.co, vert_matrix))
-
-        edge_points = []
-        edge_lengths = []
-        for edge in bm.edges:
-            edge_matrix = create_rotation_matrix_from_edge(world_matrix, edge)
-            edge_points.append((world_matrix @ v3_average([v.co for v in edge.verts]), edge_matrix))
-            edge_lengths.append(v3_distance(world_matrix @ edge.verts[0].co, world_matrix @ edge.verts[1].co))
-
-        face_points = []
-        for face in bm.faces:
-            face_matrix = create_rotation_matrix_from_face(world_matrix, face)
-            face_points.append((world_matrix @ face.calc_center_median(), face_matrix))
-
-        average_edge_length = sum(edge_lengths) / len(edge_lengths)
-        self.snap_distance_factor = average_edge_length / 2.0
-
-        self.points_cache = vert_points + edge_points + face_points
-
-        bm.free()
+        self.snap_index = get_snap_index(context.active_object, depsgraph)
+        self.surface_bvh = get_surface_bvh(context.active_object, depsgraph)
+        self.snap_distance_factor = self.snap_index['snap_distance_factor']
 
         self.operate(context)
 
@@ -144,7 +116,7 @@ class ND_OT_snap_align(BaseOperator):
             self.capture_points.append(self.snap_point)
 
             if len(self.capture_points) == 1:
-                self.guide_line = (self.capture_points[0][0], self.reference_obj.location)
+                self.guide_line = (self.capture_points[0][0], self.reference_obj.location.copy())
             else:
                 self.guide_line = (self.capture_points[0][0], self.capture_points[1][0])
 
@@ -158,51 +130,25 @@ class ND_OT_snap_align(BaseOperator):
         if len(self.capture_points) == 2:
             return
 
-        self.reference_obj.hide_set(True)
-
-        region = context.region
-        region_data = context.space_data.region_3d
-
-        view_vector = region_2d_to_vector_3d(region, region_data, mouse_coords)
-        ray_origin = region_2d_to_origin_3d(region, region_data, mouse_coords)
-
-        ray_target = ray_origin + view_vector
-        ray_direction = ray_target - ray_origin
-
-        depsgraph = context.evaluated_depsgraph_get()
-
-        hit, location, normal, face_index, object, matrix = context.scene.ray_cast(depsgraph, ray_origin, ray_direction)
-        hidden_objects = []
-        while hit and object.name != context.active_object.name:
-            hidden_objects.append(object)
-            object.hide_set(True)
-            hit, location, normal, face_index, object, matrix = context.scene.ray_cast(depsgraph, location + 0.001 * ray_direction, ray_direction)
-
-        for obj in hidden_objects:
-            obj.hide_set(False)
+        # Only the target object's surface is tested, so neither the reference object nor
+        # any occluding objects need to be hidden (and the depsgraph dirtied) on every move.
+        hit, location, normal, face_index = ray_cast_object_from_mouse(context, context.active_object, self.surface_bvh, mouse_coords)
 
         if hit:
             self.hit_location = location
 
-            self.primary_points = []
-            self.secondary_points = []
-            snap_points = []
-            for (vect, rotation_matrix) in self.points_cache:
-                if v3_distance(vect, location) <= (0.2 * self.snap_distance_factor):
-                    snap_points.append((vect, rotation_matrix))
-                elif v3_distance(vect, location) <= (0.8 * self.snap_distance_factor):
-                    self.secondary_points.append(vect)
-
-            snap_points.sort(key=lambda p: v3_distance(p[0], location))
-            self.snap_point = snap_points[0] if snap_points else None
+            self.snap_point, self.secondary_points = find_snap_points(
+                self.snap_index,
+                location,
+                0.2 * self.snap_distance_factor,
+                0.8 * self.snap_distance_factor)
+
             self.primary_points = [self.snap_point[0]] if self.snap_point else []
         else:
             self.hit_location = None
             self.primary_points = []
             self.secondary_points = []
 
-        self.reference_obj.hide_set(False)
-
         self.mark_dirty()
         self.operate(context)
 
@@ -240,6 +186,11 @@ class ND_OT_snap_align(BaseOperator):
         elif self.hit_location:
             self.reference_obj.location = self.hit_location
 
+        # Point batches are only rebuilt when a new sequence is assigned, so the guide line
+        # is replaced (with a copy of the live location) rather than left to follow it.
+        if len(self.capture_points) == 1:
+            self.guide_line = (self.capture_points[0][0], self.reference_obj.location.copy())
+
 
     def finish(self, context):
         self.clean_up(context)
@@ -26,92 +26,11 @@
 # ---
 
 import bpy
-import inspect
 from .. lib.objects import get_real_active_object
 from .. lib.polling import ctx_obj_mode, obj_exists, list_gt, app_minor_version
-
-
-hard_ignore_list = {
-    '__doc__',
-    '__module__',
-    '__slotnames__',
-    '__slots__',
-    'bl_rna',
-    'custom_profile',
-    'execution_time',
-    'is_active',
-    'is_bind',
-    'is_bound',
-    'is_cached',
-    'is_external',
-    'is_override_data',
-    'persistent_uid',
-    'rna_type',
-    'show_expanded',
-    'show_in_editmode',
-    'show_on_cage',
-    'show_render',
-    'show_viewport',
-    'type',
-}
-
-object_ignore_list = {
-    'object',
-    'offset_object',
-}
-
-property_ignore_list = {
-    'armature',
-    'auxiliary_target',
-    'bone_from',
-    'bone_to',
-    'cache_file',
-    'collection',
-    'curve',
-    'debug_options',
-    'delimit',
-    'driver',
-    'end_cap',
-    'face_count',
-    'falloff_curve',
-    'filepath',
-    'grid_name',
-    'has_velocity',
-    'map_curve',
-    'mask_tex_map_bone',
-    'mask_tex_map_object',
-    'mask_tex_uv_layer',
-    'mask_texture',
-    'mask_vertex_group',
-    'matrix_inverse',
-    'mirror_object',
-    'name',
-    'object_from',
-    'object_path',
-    'object_to',
-    'origin',
-    'projectors',
-    'read_velocity',
-    'rim_vertex_group',
-    'shell_vertex_group',
-    'start_cap',
-    'start_position_object',
-    'subtarget',
-    'target',
-    'texture_coords_bone',
-    'texture_coords_object',
-    'texture',
-    'total_levels',
-    'use_bone_envelopes',
-    'use_vertex_groups',
-    'uv_layer',
-    'vertex_group_a',
-    'vertex_group_b',
-    'vertex_group',
-    'vertex_indices_set',
-    'vertex_indices',
-    'vertex_velocities',
-}
+from .. lib.preferences import get_preferences
+from .. lib.modifiers import copy_modifier_properties
+from .. lib.sync import get_sync_props, build_gn_key_table, sync_node_group_values, remove_modifier_drivers, link_template, unlink_template
 
 
 class ND_OT_sync_modifiers(bpy.types.Operator):
@@ -119,7 +38,7 @@ class ND_OT_sync_modifiers(bpy.types.Operator):
     bl_label = "Sync Modifiers"
     bl_description = """Sync modifier settings from the active object to the selected objects
 SHIFT — Clone the active object's modifiers
-CTRL — Remove all drivers (retaining values)
+CTRL — Remove all drivers & template links (retaining values)
 ALT — Override util references on all sync'd objects"""
 
 
@@ -163,25 +82,17 @@ ALT — Override util references on all sync'd objects"""
         if self.clear_drivers:
             for obj in valid_objects:
                 for mod in obj.modifiers:
-                    mod_props = inspect.getmembers(mod, lambda a: not(inspect.isroutine(a)))
-                    for prop in mod_props:
-                        try:
-                            mod.driver_remove(prop[0])
-                        except:
-                            pass
-
-                    if mod.type == 'NODES':
-                        key_table = self.build_gn_key_table(mod)
-                        for key in key_table:
-                            try:
-                                mod.driver_remove(f'["{key}"]')
-                            except:
-                                pass
+                    remove_modifier_drivers(mod)
 
+                unlink_template(obj)
                 obj.data.update()
 
             return {'FINISHED'}
 
+        # In template mode no drivers are created, the copies are linked to the master
+        # instead and updated in bulk whenever the master's modifiers change.
+        self.use_drivers = get_preferences().sync_modifiers_mode == 'DRIVERS'
+
         if self.clone:
             for obj in self.copy_objects:
                 obj.modifiers.clear()
@@ -215,59 +126,38 @@ ALT — Override util references on all sync'd objects"""
         for mod in pinned_mods:
             mod.use_pin_to_last = True
 
-        return {'FINISHED'}
-
-
-    def build_gn_key_table(self, mod):
-        # Build a dictionary of all the properties and their optional attributes to more
-        # effectively sync them as drivers cannot be added to properties with use_attribute set.
-        keys = list(mod.keys())
-        key_table = dict()
-        for key in keys:
-            if not key.endswith("_use_attribute") and not key.endswith("_attribute_name"):
-                key_table[key] = {}
-                key_table[key]["value"] = mod[key]
-            if key.endswith("_use_attribute"):
-                key_table[key[:-14]]["_use_attribute"] = mod[key]
-            if key.endswith("_attribute_name"):
-                key_table[key[:-15]]["_attribute_name"] = mod[key]
+        for obj in self.copy_objects:
+            if self.use_drivers:
+                unlink_template(obj)
+            else:
+                link_template(self.master_object, obj, self.override_utils)
 
-        return key_table
+        return {'FINISHED'}
 
 
     def sync_node_group(self, master_modifier, mod):
-        mod.node_group = master_modifier.node_group
-        mod.show_group_selector = master_modifier.show_group_selector
+        key_table = build_gn_key_table(master_modifier)
+
+        sync_node_group_values(master_modifier, mod, key_table)
 
-        key_table = self.build_gn_key_table(master_modifier)
+        if not self.use_drivers:
+            return
 
         for key in key_table:
-            mod[key] = key_table[key]["value"]
+            if "_use_attribute" in key_table[key] and not key_table[key]["_use_attribute"]:
+                self.create_gnmod_driver(master_modifier, mod, key)
 
-            if "_use_attribute" in key_table[key]:
-                use_attribute = key_table[key]["_use_attribute"]
-                mod[key + "_use_attribute"] = bool(use_attribute)
-                if not use_attribute:
-                    self.create_gnmod_driver(master_modifier, mod, key)
 
-            if "_attribute_name" in key_table[key]:
-                mod[key + "_attribute_name"] = key_table[key]["_attribute_name"]
+    def sync_vanilla_mod(self, master_modifier, mod):
+        copy_props, driver_props = get_sync_props(master_modifier, self.override_utils)
 
+        copy_modifier_properties(master_modifier, mod, copy_props)
 
-    def sync_vanilla_mod(self, master_modifier, mod):
-        mod_props = inspect.getmembers(master_modifier, lambda a: not(inspect.isroutine(a)))
-        mod_props = [prop for prop in mod_props if not(prop[0] in hard_ignore_list)]
-
-        for prop in mod_props:
-            try:
-                obj_key = prop[0] in object_ignore_list
-                if not obj_key or (obj_key and self.override_utils):
-                    setattr(mod, prop[0], prop[1])
-            except:
-                pass
-
-            if not prop[0] in property_ignore_list:
-                self.create_vmod_driver(master_modifier, mod, prop[0])
+        if not self.use_drivers:
+            return
+
+        for prop in driver_props:
+            self.create_vmod_driver(master_modifier, mod, prop)
 
 
     def create_vmod_driver(self, master_mod, copy_mod, prop):